@@ -1,4 +1,5 @@
-from .trading import TradingAgent, TradingConfig
+from typing import Any
+
 from .research import TickerResearchAgent, TickerResearchConfig
 
 __all__ = [
@@ -7,3 +8,13 @@ __all__ = [
     "TickerResearchAgent",
     "TickerResearchConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # The trading agent pulls in the indicator kernels (and numba when
+    # installed); import it on first access so research-only users skip that.
+    if name in ("TradingAgent", "TradingConfig"):
+        from . import trading
+
+        return getattr(trading, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional
+import functools
 import pathlib
 
 try:
@@ -10,17 +13,82 @@ try:
 except Exception:  # pragma: no cover
     yaml = None  # type: ignore
 
+# Prefer the LibYAML-backed loader when PyYAML was built against it.
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - pure-Python build or PyYAML missing
+    _SafeLoader = getattr(yaml, "SafeLoader", None)
+
+# Optional SIMD/C++ parser, used ahead of PyYAML when installed.
+try:
+    import pyfastyaml as _fast_yaml  # type: ignore
+except Exception:  # pragma: no cover - optional
+    _fast_yaml = None
+
 from agentic_lab.core.base import AgentConfig
 from agentic_lab.core.exceptions import AgentError
 
+# Single source of truth for the default report layout; copied per config so
+# callers may still edit ``sections`` in place.
+_DEFAULT_SECTIONS: tuple[str, ...] = (
+    "Executive Summary",
+    "Company Overview",
+    "Market & Price Action",
+    "Technical Analysis",
+    "Recent News & Catalysts",
+    "Fundamentals Snapshot",
+    "Sentiment & Analyst Tone",
+    "Opportunities",
+    "Risks",
+    "Trading Recommendation",
+    "Quantitative Scores",
+    "Action Items",
+)
+
+_PROFILES_RELPATH = pathlib.Path("configs") / "trading_profiles.yaml"
+
+
+def _packaged_profile_candidates() -> tuple[pathlib.Path, ...]:
+    """Profile locations relative to this file, resolved once at import."""
+    file_path = pathlib.Path(__file__).resolve()
+    candidates = []
+    # config.py -> trader -> agents -> agentic_lab -> src -> project_root
+    for level in (4, 3):
+        try:
+            candidates.append(file_path.parents[level] / _PROFILES_RELPATH)
+        except IndexError:  # pragma: no cover
+            pass
+    return tuple(candidates)
+
+
+_PACKAGED_PROFILE_CANDIDATES = _packaged_profile_candidates()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_profiles_cached(path_str: str, mtime_ns: int) -> Any:
+    """Parse a profiles YAML file, memoized on path and modification time.
 
-@dataclass
+    ``mtime_ns`` is only part of the cache key: editing the file changes it and
+    forces a fresh parse on the next lookup.
+    """
+    text = pathlib.Path(path_str).read_text(encoding="utf-8")
+    return _load_yaml(text) or {}
+
+
+def _load_yaml(text: str) -> Any:
+    """Parse YAML with the fastest backend: pyfastyaml, then LibYAML, then pure Python."""
+    if _fast_yaml is not None:
+        return _fast_yaml.loads(text)
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+@dataclass(slots=True)
 class TickerResearchConfig(AgentConfig):
     """Configuration for ticker research & report generation.
 
     Parameters
     ----------
-    ticker: Stock symbol.
+    ticker: Stock symbol (normalized to upper case).
     trading_profile: Named profile referencing YAML (e.g. 'daily_1', 'weekly_1').
     profile_config_path: Path to YAML profiles file. Defaults to ``configs/trading_profiles.yaml``.
     lookback_days: Override for number of calendar days to analyze (if provided overrides profile value).
@@ -53,6 +121,8 @@ class TickerResearchConfig(AgentConfig):
 
     # Derived / internal fields not set by user
     _profile_applied: bool = field(default=False, init=False, repr=False)
+    # Set by ProfileManager.apply_profile_if_needed()
+    _risk_tolerance: str = field(default="moderate", init=False, repr=False)
     
     @property
     def trading_frequency(self) -> Optional[str]:
@@ -62,7 +132,6 @@ class TickerResearchConfig(AgentConfig):
     @property
     def timestamp(self) -> str:
         """Get current timestamp for reporting."""
-        from datetime import datetime
         return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
     @property 
@@ -74,32 +143,17 @@ class TickerResearchConfig(AgentConfig):
     @property
     def risk_tolerance(self) -> str:
         """Get risk tolerance from trading profile or default."""
-        # This will be set by ProfileManager.apply_profile_if_needed()
-        if hasattr(self, '_risk_tolerance'):
-            return self._risk_tolerance
-        return "moderate"  # Default fallback
+        return self._risk_tolerance
 
-    def __post_init__(self) -> None:  # type: ignore[override]
-        super().__post_init__()
+    def __post_init__(self) -> None:
+        # Zero-argument super() does not work in slots=True dataclasses.
+        AgentConfig.__post_init__(self)
         if not self.ticker:
             raise AgentError("TickerResearchConfig requires non-empty ticker")
+        self.ticker = self.ticker.upper()
         if self.max_results <= 0:
             raise AgentError("max_results must be > 0")
-        if self.sections is None:
-            self.sections = [
-                "Executive Summary",
-                "Company Overview",
-                "Market & Price Action",
-                "Technical Analysis",
-                "Recent News & Catalysts",
-                "Fundamentals Snapshot",
-                "Sentiment & Analyst Tone",
-                "Opportunities",
-                "Risks",
-                "Trading Recommendation",
-                "Quantitative Scores",
-                "Action Items",
-            ]
+        self.sections = list(_DEFAULT_SECTIONS) if self.sections is None else self.sections
 
 
 class ProfileManager:
@@ -108,30 +162,15 @@ class ProfileManager:
     def __init__(self, config: TickerResearchConfig, logger):
         self.config = config
         self.logger = logger
-        self._profile_meta: Dict[str, Any] = {}
+        self._profile_meta: Mapping[str, Any] = MappingProxyType({})
     
     def default_profile_path(self) -> pathlib.Path:
         """Resolve profile file path with robust fallbacks."""
         if self.config.profile_config_path:
             return pathlib.Path(self.config.profile_config_path)
 
-        file_path = pathlib.Path(__file__).resolve()
-        # Go up from trader/config.py to project root
-        candidates = []
-        try:
-            project_root = file_path.parents[4]  # config.py -> trader -> agents -> agentic_lab -> src -> project_root
-            candidates.append(project_root / "configs" / "trading_profiles.yaml")
-        except IndexError:  # pragma: no cover
-            pass
-        
-        # Additional fallbacks
-        try:
-            candidates.append(file_path.parents[3] / "configs" / "trading_profiles.yaml")
-        except IndexError:  # pragma: no cover
-            pass
-        
-        candidates.append(pathlib.Path.cwd() / "configs" / "trading_profiles.yaml")
-
+        # cwd is looked up per call since it may change during the process.
+        candidates = (*_PACKAGED_PROFILE_CANDIDATES, pathlib.Path.cwd() / _PROFILES_RELPATH)
         for c in candidates:
             if c.exists():
                 return c
@@ -143,11 +182,11 @@ class ProfileManager:
             profiles_path = self.default_profile_path()
             if not profiles_path.exists():
                 raise AgentError(f"Profile file not found: {profiles_path}")
-            if yaml is None:
+            if yaml is None and _fast_yaml is None:
                 raise AgentError("PyYAML not installed; required for profile loading")
             
-            with profiles_path.open("r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            st = profiles_path.stat()
+            data = _load_profiles_cached(str(profiles_path), st.st_mtime_ns)
             profiles = (data.get("profiles") or {}) if isinstance(data, dict) else {}
             if self.config.trading_profile not in profiles:
                 raise AgentError(f"Unknown trading_profile '{self.config.trading_profile}'")
@@ -161,19 +200,17 @@ class ProfileManager:
             # Set risk tolerance from profile (always comes from profile)
             self.config._risk_tolerance = profile.get("risk_tolerance", "moderate")
             
-            self._profile_meta = profile
+            # Read-only view: the parsed profiles are shared via the YAML cache.
+            self._profile_meta = MappingProxyType(profile)
             self.config._profile_applied = True
         
         # Provide defaults if still unset
         if self.config.lookback_days is None:
             self.config.lookback_days = 21
-        # Set default risk tolerance if no profile was applied
-        if not hasattr(self.config, '_risk_tolerance'):
-            self.config._risk_tolerance = "moderate"
     
     @property
-    def profile_meta(self) -> Dict[str, Any]:
-        """Get loaded profile metadata."""
+    def profile_meta(self) -> Mapping[str, Any]:
+        """Get loaded profile metadata (read-only view, no copy)."""
         return self._profile_meta
 
 
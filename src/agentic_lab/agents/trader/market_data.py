@@ -1,23 +1,96 @@
 """Market data fetching and technical analysis."""
 from __future__ import annotations
 
+from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
+import contextlib
+import hashlib
 import logging
+import pathlib
+import pickle
+import re
+
+import pandas as pd
 
-try:
-    import yfinance as yf  # type: ignore
-    import pandas as pd  # type: ignore
-except Exception:  # pragma: no cover
-    yf = None  # type: ignore
-    pd = None  # type: ignore
-
-from agentic_lab.agents.trader.stock_analysis.analyzer import (
-    calculate_moving_average,
-    calculate_rsi,
-    calculate_macd,
-)
 from .config import TickerResearchConfig
 
+# On-disk history cache; entries are keyed by calendar day so they expire daily.
+_CACHE_DIR = pathlib.Path.home() / ".cache" / "agentic_lab" / "yf"
+
+# yfinance is imported on first use (see _yfinance); None until then or when
+# it is not installed.
+yf: Any = None
+_YF_PROBED = False
+
+
+def _yfinance() -> Any:
+    """Import yfinance on first call; returns the module, or None if not installed."""
+    global yf, _YF_PROBED
+    if yf is None and not _YF_PROBED:
+        _YF_PROBED = True
+        try:
+            import yfinance  # type: ignore
+        except Exception:  # pragma: no cover - optional
+            yfinance = None
+        yf = yfinance
+    return yf
+
+
+def _cache_path(ticker: str, fetch_days: int, day_key: str) -> pathlib.Path:
+    """On-disk cache file for one download, always directly inside ``_CACHE_DIR``.
+
+    Characters outside Yahoo's ticker alphabet (path separators, ...) become
+    ``_``; a short hash of the original ticker then keeps distinct tickers apart.
+    """
+    name = re.sub(r"[^A-Za-z0-9.^=-]", "_", ticker)
+    if name != ticker:
+        name += "-" + hashlib.sha1(ticker.encode("utf-8")).hexdigest()[:8]
+    return _CACHE_DIR / f"{name}_{fetch_days}_{day_key}.pkl"
+
+
+class _EmptyHistory(Exception):
+    """Raised by ``_fetch_history`` for an empty download, so it is not memoized."""
+
+
+@lru_cache(maxsize=64)
+def _fetch_history(ticker: str, fetch_days: int, day_key: str) -> Any:
+    """Fetch daily price history, memoized in-process and on disk per day.
+    
+    Empty downloads raise ``_EmptyHistory`` and are cached nowhere, so the
+    next call retries. Callers must not mutate the returned DataFrame; it is
+    shared by every hit.
+    """
+    path = _cache_path(ticker, fetch_days, day_key)
+    try:
+        with path.open("rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:  # truncated, or pickled by another pandas/Python version
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+    hist = yf.Ticker(ticker).history(period=f"{fetch_days}d")
+    if hist.empty:
+        raise _EmptyHistory(ticker)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with path.open("wb") as f:
+            pickle.dump(hist, f, protocol=pickle.HIGHEST_PROTOCOL)
+        _prune_cache(day_key)
+    except OSError:  # pragma: no cover - read-only home, full disk, ...
+        pass
+    return hist
+
+
+def _prune_cache(day_key: str) -> None:
+    """Delete cached histories from days other than ``day_key``."""
+    for stale in _CACHE_DIR.glob("*.pkl"):
+        if not stale.stem.endswith(f"_{day_key}"):
+            with contextlib.suppress(OSError):
+                stale.unlink()
+
 
 class MarketDataProvider:
     """Handles market data fetching and technical analysis computation."""
@@ -27,9 +100,13 @@ class MarketDataProvider:
         self.logger = logger
         self.technical_indicators: Dict[str, Any] = {}
     
+    def reset_ticker_state(self) -> None:
+        """Forget the indicator summary of the previous ticker."""
+        self.technical_indicators = {}
+    
     def fetch_market_data(self) -> Dict[str, Any]:
         """Fetch market data with extended history for technical analysis."""
-        if yf is None:
+        if _yfinance() is None:
             return {"available": False, "reason": "yfinance not installed"}
         
         try:
@@ -38,16 +115,16 @@ class MarketDataProvider:
             # Get more data for technical analysis if enabled
             fetch_days = max(lookback + 50, 90) if self.config.include_technical_analysis else max(lookback, 5)
             
-            ticker_obj = yf.Ticker(self.config.ticker)
-            hist = ticker_obj.history(period=f"{fetch_days}d")
-            if hist.empty:
+            try:
+                hist = _fetch_history(self.config.ticker, fetch_days, date.today().isoformat())
+            except _EmptyHistory:
                 self.logger.warning("Market data history is empty")
                 return {"available": False, "reason": "empty history"}
-            
-            closes = hist["Close"].dropna()
-            volume = hist["Volume"].dropna()
-            highs = hist["High"].dropna()
-            lows = hist["Low"].dropna()
+            # One pass over the frame; dropna also returns a new frame, so the
+            # indicators added below never touch the cached history.
+            hist = hist.dropna(subset=["Close", "Volume", "High", "Low"])
+            closes = hist["Close"]
+            volume = hist["Volume"]
             
             # Basic performance metrics
             pct_change_total = ((closes.iloc[-1] / closes.iloc[0]) - 1) * 100 if len(closes) > 1 else 0
@@ -70,12 +147,6 @@ class MarketDataProvider:
                 "observations": len(closes),
                 "lookback_days": lookback,
                 "dataframe": hist,  # Return the full DataFrame with technical indicators
-                "raw_data": {
-                    "close": closes.tolist(),
-                    "volume": volume.tolist(),
-                    "high": highs.tolist(),
-                    "low": lows.tolist(),
-                } if self.config.include_technical_analysis else None,
             }
         except Exception as exc:  # pragma: no cover - network dependent
             self.logger.error(f"Market data fetch failed: {exc}")
@@ -85,39 +156,40 @@ class MarketDataProvider:
         """Compute technical indicators and add them to the DataFrame."""
         try:
             self.logger.info("Computing technical indicators")
-            close_list = df["Close"].tolist()
-            high_list = df["High"].tolist()
-            low_list = df["Low"].tolist()
+            close = df["Close"]
             
             # Moving averages
-            sma_20 = calculate_moving_average(close_list, 20)
-            sma_50 = calculate_moving_average(close_list, 50) if len(close_list) >= 50 else None
+            sma_20 = close.rolling(20).mean()
+            sma_50 = close.rolling(50).mean() if len(close) >= 50 else None
             
-            # RSI
-            rsi = calculate_rsi(close_list, 14)
+            # RSI with Wilder smoothing of gains/losses
+            delta = close.diff()
+            avg_gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+            avg_loss = (-delta.clip(upper=0)).ewm(alpha=1 / 14, adjust=False, min_periods=14).mean()
+            rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+            rsi = rsi.mask((avg_loss == 0) & (avg_gain == 0), 50.0)
             
             # MACD
-            macd_line, signal_line, histogram = calculate_macd(close_list)
+            macd_line = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+            signal_line = macd_line.ewm(span=9, adjust=False).mean()
+            histogram = macd_line - signal_line
             
-            # Add indicators to DataFrame (pad with NaN if different lengths)
-            if len(sma_20) == len(df):
-                df["SMA_20"] = sma_20
-            if sma_50 and len(sma_50) == len(df):
+            # Add indicators to DataFrame
+            df["SMA_20"] = sma_20
+            if sma_50 is not None:
                 df["SMA_50"] = sma_50
-            if len(rsi) == len(df):
-                df["RSI"] = rsi
-            if len(macd_line) == len(df):
-                df["MACD"] = macd_line
-                df["MACD_Signal"] = signal_line
-                df["MACD_Histogram"] = histogram
+            df["RSI"] = rsi
+            df["MACD"] = macd_line
+            df["MACD_Signal"] = signal_line
+            df["MACD_Histogram"] = histogram
             
             # Store summary for reporting
-            current_price = close_list[-1]
-            current_sma20 = sma_20[-1] if sma_20 and len(sma_20) > 0 else None
-            current_sma50 = sma_50[-1] if sma_50 and len(sma_50) > 0 else None
-            current_rsi = rsi[-1] if rsi and len(rsi) > 0 else None
-            current_macd = macd_line[-1] if macd_line and len(macd_line) > 0 else None
-            current_signal = signal_line[-1] if signal_line and len(signal_line) > 0 else None
+            current_price = float(close.iloc[-1])
+            current_sma20 = _last(sma_20)
+            current_sma50 = _last(sma_50)
+            current_rsi = _last(rsi)
+            current_macd = _last(macd_line)
+            current_signal = _last(signal_line)
             
             self.technical_indicators = {
                 "sma_20": round(current_sma20, 2) if current_sma20 else None,
@@ -140,4 +212,11 @@ class MarketDataProvider:
             return df
 
 
+def _last(values: Optional[pd.Series]) -> Optional[float]:
+    """Return the final element as a float, or None when missing/NaN."""
+    if values is None or values.empty or pd.isna(values.iloc[-1]):
+        return None
+    return float(values.iloc[-1])
+
+
 __all__ = ["MarketDataProvider"]
\ No newline at end of file
@@ -1,16 +1,29 @@
 """Report generation and formatting for ticker research."""
 from __future__ import annotations
 
+from collections import Counter
+from datetime import datetime
+from itertools import islice
+import io
 from typing import Dict, Any, List, Optional, Tuple
 import logging
 
-try:
-    import openai
-except Exception:  # pragma: no cover - optional
-    openai = None  # type: ignore
-
 from agentic_lab.core.exceptions import AgentError
 from .config import TickerResearchConfig
+from .search import SearchResult
+
+# BUY position sizing keyed by (confidence tier, risk tolerance).
+_BUY_POSITION_SIZES: Dict[Tuple[str, str], str] = {
+    ("high", "conservative"): "Small position",
+    ("high", "moderate"): "Standard position",
+    ("high", "aggressive"): "Large position",
+    ("med", "conservative"): "Very small position",
+    ("med", "moderate"): "Small position",
+    ("med", "aggressive"): "Standard position",
+    ("low", "conservative"): "Avoid",
+    ("low", "moderate"): "Very small position",
+    ("low", "aggressive"): "Small position",
+}
 
 
 class ReportProvider:
@@ -19,28 +32,52 @@ class ReportProvider:
     def __init__(self, config: TickerResearchConfig, logger: logging.Logger):
         self.config = config
         self.logger = logger
-        self._llm_client = openai.OpenAI(api_key=config.openai_api_key) if openai and config.openai_api_key else None
+        self._llm_client = None  # created on first use, see ``_client``
+        self._last_row: Optional[Tuple[Any, Dict[str, Any]]] = None
+        self._report_ts = _now()
+    
+    def reset_ticker_state(self) -> None:
+        """Drop the memoized last row of the previous ticker's DataFrame."""
+        self._last_row = None
+    
+    @property
+    def _client(self) -> Optional[Any]:
+        """Lazily import openai and construct the client; None when unavailable."""
+        if self._llm_client is None and self.config.openai_api_key:
+            try:
+                from openai import OpenAI
+            except ImportError:
+                return None
+            self._llm_client = OpenAI(api_key=self.config.openai_api_key)
+        return self._llm_client
+    
+    def _latest_row(self, df: Any) -> Dict[str, Any]:
+        """Return the last row of ``df`` as a dict, shared across one report's formatters."""
+        if self._last_row is None or self._last_row[0] is not df:
+            self._last_row = (df, df.iloc[-1].to_dict())
+        return self._last_row[1]
     
     def format_data_summary(
         self,
         df: Optional[Any],
-        search_results: List[Dict[str, Any]],
+        search_results: List[SearchResult],
         scores: Dict[str, float],
     ) -> str:
         """Format data summary section."""
-        summary = [f"# {self.config.ticker.upper()} Research Summary"]
+        buf = io.StringIO()
+        buf.write(f"# {self.config.ticker} Research Summary")
         
         # Market data summary
         if df is not None and not df.empty:
-            latest = df.iloc[-1]
+            latest = self._latest_row(df)
             price = latest.get("Close")
             volume = latest.get("Volume")
             
-            summary.append("\n## Market Data")
+            buf.write("\n\n## Market Data")
             if price:
-                summary.append(f"- Current Price: ${price:.2f}")
+                buf.write(f"\n- Current Price: ${price:.2f}")
             if volume:
-                summary.append(f"- Volume: {volume:,.0f}")
+                buf.write(f"\n- Volume: {volume:,.0f}")
             
             # Technical indicators
             rsi = latest.get("RSI")
@@ -48,33 +85,29 @@ class ReportProvider:
             macd = latest.get("MACD")
             
             if any(x is not None for x in [rsi, sma_20, macd]):
-                summary.append("\n## Technical Indicators")
+                buf.write("\n\n## Technical Indicators")
                 if rsi is not None:
-                    summary.append(f"- RSI: {rsi:.2f}")
+                    buf.write(f"\n- RSI: {rsi:.2f}")
                 if sma_20 is not None:
-                    summary.append(f"- SMA(20): ${sma_20:.2f}")
+                    buf.write(f"\n- SMA(20): ${sma_20:.2f}")
                 if macd is not None:
-                    summary.append(f"- MACD: {macd:.4f}")
+                    buf.write(f"\n- MACD: {macd:.4f}")
         
         # Search results summary
         if search_results:
-            summary.append(f"\n## Information Sources")
-            summary.append(f"- Total sources analyzed: {len(search_results)}")
-            
-            categories = {}
-            for result in search_results:
-                cat = result.get("category", "general")
-                categories[cat] = categories.get(cat, 0) + 1
+            buf.write(f"\n\n## Information Sources")
+            buf.write(f"\n- Total sources analyzed: {len(search_results)}")
             
+            categories = Counter(r.category for r in search_results)
             for cat, count in categories.items():
-                summary.append(f"- {cat.title()} sources: {count}")
+                buf.write(f"\n- {cat.title()} sources: {count}")
         
         # Quantitative scores
-        summary.append(f"\n## Quantitative Analysis")
+        buf.write(f"\n\n## Quantitative Analysis")
         for score_name, value in scores.items():
-            summary.append(f"- {score_name.title()} Score: {value:.2f} ({self._score_interpretation(value)})")
+            buf.write(f"\n- {score_name.title()} Score: {value:.2f} ({self._score_interpretation(value)})")
         
-        return "\n".join(summary)
+        return buf.getvalue()
     
     def _score_interpretation(self, score: float) -> str:
         """Convert numeric score to interpretation."""
@@ -93,24 +126,25 @@ class ReportProvider:
         current_price: Optional[float] = None,
     ) -> str:
         """Format trading recommendation section."""
-        rec = ["\n## Trading Recommendation"]
+        buf = io.StringIO()
+        buf.write("\n## Trading Recommendation")
         
         # Signal with confidence
-        rec.append(f"**Signal: {signal}** (Confidence: {confidence:.1%})")
-        rec.append(f"\n**Reasoning:** {reasoning}")
+        buf.write(f"\n**Signal: {signal}** (Confidence: {confidence:.1%})")
+        buf.write(f"\n\n**Reasoning:** {reasoning}")
         
         # Risk assessment
         risk_level = self._assess_risk_level(confidence, signal)
-        rec.append(f"\n**Risk Assessment:** {risk_level}")
+        buf.write(f"\n\n**Risk Assessment:** {risk_level}")
         
         # Position sizing guidance
         position_guidance = self._position_sizing_guidance(signal, confidence)
-        rec.append(f"\n**Position Sizing:** {position_guidance}")
+        buf.write(f"\n\n**Position Sizing:** {position_guidance}")
         
         if current_price:
-            rec.append(f"\n**Reference Price:** ${current_price:.2f}")
+            buf.write(f"\n\n**Reference Price:** ${current_price:.2f}")
         
-        return "\n".join(rec)
+        return buf.getvalue()
     
     def _assess_risk_level(self, confidence: float, signal: str) -> str:
         """Assess risk level based on confidence and signal."""
@@ -123,64 +157,56 @@ class ReportProvider:
     
     def _position_sizing_guidance(self, signal: str, confidence: float) -> str:
         """Provide position sizing guidance."""
-        risk_tolerance = self.config.risk_tolerance.lower()
-        
-        if signal == "BUY":
-            if confidence >= 0.8:
-                sizes = {"conservative": "Small position", "moderate": "Standard position", "aggressive": "Large position"}
-            elif confidence >= 0.6:
-                sizes = {"conservative": "Very small position", "moderate": "Small position", "aggressive": "Standard position"}
-            else:
-                sizes = {"conservative": "Avoid", "moderate": "Very small position", "aggressive": "Small position"}
-        elif signal == "SELL":
+        if signal == "SELL":
             return "Consider reducing/closing positions"
-        else:  # HOLD
+        if signal != "BUY":  # HOLD
             return "Maintain current position size"
         
-        return sizes.get(risk_tolerance, "Standard position")
+        tier = "high" if confidence >= 0.8 else "med" if confidence >= 0.6 else "low"
+        return _BUY_POSITION_SIZES.get((tier, self.config.risk_tolerance.lower()), "Standard position")
     
     def build_llm_prompt(
         self,
-        search_results: List[Dict[str, Any]],
+        search_results: List[SearchResult],
         scores: Dict[str, float],
         df: Optional[Any] = None,
     ) -> str:
         """Build comprehensive LLM prompt for analysis."""
-        prompt_parts = [
-            f"You are a professional financial analyst. Analyze {self.config.ticker.upper()} stock.",
-            f"Trading Profile: {self.config.trading_frequency} ({self.config.risk_tolerance} risk tolerance)",
-            f"Analysis Period: {self.config.lookback_days} days\n"
-        ]
+        buf = io.StringIO()
+        buf.write(f"You are a professional financial analyst. Analyze {self.config.ticker} stock.")
+        buf.write(f"\nTrading Profile: {self.config.trading_frequency} ({self.config.risk_tolerance} risk tolerance)")
+        buf.write(f"\nAnalysis Period: {self.config.lookback_days} days\n")
         
         # Market context
         if df is not None and not df.empty:
-            latest = df.iloc[-1]
+            latest = self._latest_row(df)
             price = latest.get("Close")
             rsi = latest.get("RSI")
             
-            prompt_parts.append("MARKET DATA:")
+            buf.write("\nMARKET DATA:")
             if price:
-                prompt_parts.append(f"Current Price: ${price:.2f}")
+                buf.write(f"\nCurrent Price: ${price:.2f}")
             if rsi is not None:
-                prompt_parts.append(f"RSI: {rsi:.2f}")
+                buf.write(f"\nRSI: {rsi:.2f}")
         
         # Quantitative analysis
-        prompt_parts.append(f"\nQUANTITATIVE SCORES:")
+        buf.write(f"\n\nQUANTITATIVE SCORES:")
         for name, score in scores.items():
-            prompt_parts.append(f"{name.title()}: {score:.2f}/1.0")
+            buf.write(f"\n{name.title()}: {score:.2f}/1.0")
         
         # Information sources
         if search_results:
-            prompt_parts.append(f"\nINFORMATION SOURCES ({len(search_results)} items):")
-            for i, result in enumerate(search_results[:8], 1):  # Limit for prompt size
-                title = result.get("title", "")[:100]
-                snippet = result.get("snippet", "")[:200]
-                category = result.get("category", "general")
-                prompt_parts.append(f"{i}. [{category.upper()}] {title}")
+            buf.write(f"\n\nINFORMATION SOURCES ({len(search_results)} items):")
+            for i, result in enumerate(islice(search_results, 8), 1):  # Limit for prompt size
+                title = (result.title or "")[:100]
+                snippet = (result.snippet or "")[:200]
+                category = result.category
+                buf.write(f"\n{i}. [{category.upper()}] {title}")
                 if snippet:
-                    prompt_parts.append(f"   {snippet}...")
+                    buf.write(f"\n   {snippet}...")
         
-        prompt_parts.append(f"""
+        buf.write(f"""
+
 ANALYSIS REQUEST:
 1. Synthesize all information into actionable insights
 2. Assess key catalysts and risks for {self.config.trading_frequency} timeframe
@@ -190,17 +216,18 @@ ANALYSIS REQUEST:
 
 Format your response with clear sections and bullet points.""")
         
-        return "\n".join(prompt_parts)
+        return buf.getvalue()
     
     def generate_llm_analysis(self, prompt: str) -> Optional[str]:
         """Generate LLM-powered analysis."""
-        if not self._llm_client:
+        client = self._client
+        if client is None:
             self.logger.warning("OpenAI client not configured - skipping LLM analysis")
             return None
         
         try:
             self.logger.info("Generating LLM analysis...")
-            response = self._llm_client.chat.completions.create(
+            response = client.chat.completions.create(
                 model=self.config.model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=1500,
@@ -218,7 +245,7 @@ Format your response with clear sections and bullet points.""")
     def generate_comprehensive_report(
         self,
         df: Optional[Any],
-        search_results: List[Dict[str, Any]],
+        search_results: List[SearchResult],
         scores: Dict[str, float],
         signal: str,
         confidence: float,
@@ -226,17 +253,17 @@ Format your response with clear sections and bullet points.""")
     ) -> str:
         """Generate the complete research report."""
         self.logger.info("Assembling comprehensive report...")
+        self._report_ts = _now()  # one timestamp for every section of this report
         
-        report_sections = []
+        buf = io.StringIO()
         
         # Data summary
-        report_sections.append(self.format_data_summary(df, search_results, scores))
+        buf.write(self.format_data_summary(df, search_results, scores))
         
         # Trading recommendation
-        current_price = df.iloc[-1].get("Close") if df is not None and not df.empty else None
-        report_sections.append(
-            self.format_trading_recommendation(signal, confidence, reasoning, current_price)
-        )
+        current_price = self._latest_row(df).get("Close") if df is not None and not df.empty else None
+        buf.write("\n\n")
+        buf.write(self.format_trading_recommendation(signal, confidence, reasoning, current_price))
         
         # LLM analysis
         if self.config.enable_llm_analysis and self.config.openai_api_key:
@@ -244,44 +271,51 @@ Format your response with clear sections and bullet points.""")
             llm_analysis = self.generate_llm_analysis(prompt)
             
             if llm_analysis:
-                report_sections.append("\n## Professional Analysis")
-                report_sections.append(llm_analysis)
+                buf.write("\n\n\n## Professional Analysis\n\n")
+                buf.write(llm_analysis)
         
         # Source details
         if search_results and self.config.include_source_details:
-            report_sections.append(self._format_source_details(search_results))
+            buf.write("\n\n")
+            buf.write(self._format_source_details(search_results))
         
         # Configuration info
-        report_sections.append(self._format_config_footer())
+        buf.write("\n\n")
+        buf.write(self._format_config_footer())
         
         self.logger.info("Report generation complete")
-        return "\n\n".join(report_sections)
+        return buf.getvalue()
     
-    def _format_source_details(self, search_results: List[Dict[str, Any]]) -> str:
+    def _format_source_details(self, search_results: List[SearchResult]) -> str:
         """Format detailed source information."""
-        details = ["\n## Source Details"]
+        buf = io.StringIO()
+        buf.write("\n## Source Details")
         
         for i, result in enumerate(search_results, 1):
-            title = result.get("title", "Untitled")[:80]
-            url = result.get("url", "")
-            category = result.get("category", "general")
+            title = (result.title or "Untitled")[:80]
+            url = result.url
+            category = result.category
             
-            details.append(f"\n{i}. **[{category.upper()}]** {title}")
+            buf.write(f"\n\n{i}. **[{category.upper()}]** {title}")
             if url:
-                details.append(f"   Source: {url}")
+                buf.write(f"\n   Source: {url}")
         
-        return "\n".join(details)
+        return buf.getvalue()
     
     def _format_config_footer(self) -> str:
         """Format configuration information footer."""
         return f"""
 ---
 **Analysis Configuration:**
-- Ticker: {self.config.ticker.upper()}
+- Ticker: {self.config.ticker}
 - Profile: {self.config.trading_frequency} ({self.config.risk_tolerance} risk)
 - Lookback: {self.config.lookback_days} days
 - Sources: {self.config.max_results} max
-- Generated: {self.config.timestamp}"""
+- Generated: {self._report_ts}"""
+
+
+def _now() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
 
 __all__ = ["ReportProvider"]
\ No newline at end of file
@@ -22,6 +22,7 @@ Safety Note: Network calls (search & LLM) are optional; module degrades graceful
 """
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 import logging
 
@@ -32,7 +33,7 @@ from agentic_lab.utils.logging import setup_logger
 # Modular components
 from agentic_lab.agents.trader.config import TickerResearchConfig, ProfileManager
 from agentic_lab.agents.trader.market_data import MarketDataProvider
-from agentic_lab.agents.trader.search import SearchProvider
+from agentic_lab.agents.trader.search import SearchProvider, SearchResult
 from agentic_lab.agents.trader.scoring import ScoreProvider
 from agentic_lab.agents.trader.reporting import ReportProvider
 
@@ -42,7 +43,7 @@ class TickerResearchAgent(Agent):
 
     def __init__(self, config: TickerResearchConfig) -> None:
         super().__init__(config)
-        self._logger = setup_logger(f"TickerResearchAgent[{config.ticker.upper()}]")
+        self._logger = setup_logger(f"TickerResearchAgent[{config.ticker}]")
         self._step_counter = 0
         
         # Initialize modular components
@@ -53,7 +54,7 @@ class TickerResearchAgent(Agent):
         self._report_provider = ReportProvider(config, self._logger)
         
         # Data storage
-        self._raw_results: List[Dict[str, Any]] = []
+        self._raw_results: List[SearchResult] = []
         self._market_data: Optional[Any] = None
         self._quantitative_scores: Dict[str, float] = {}
         self._trading_signal: Optional[Dict[str, Any]] = None
@@ -80,14 +81,12 @@ class TickerResearchAgent(Agent):
         if not self.is_initialized():
             raise AgentError("TickerResearchAgent not initialized")
         
-        if ticker and ticker != self.cfg.ticker:
-            self.cfg.ticker = ticker
-            # Update all components with new ticker
-            self._profile_manager = ProfileManager(self.cfg, self._logger)
-            self._market_data_provider = MarketDataProvider(self.cfg, self._logger)
-            self._search_provider = SearchProvider(self.cfg, self._logger)
-            self._score_provider = ScoreProvider(self.cfg, self._logger)
-            self._report_provider = ReportProvider(self.cfg, self._logger)
+        if ticker and ticker.upper() != self.cfg.ticker:
+            # Providers share self.cfg and read the ticker at call time, so they
+            # (and their warm clients) are kept; only per-ticker state resets.
+            self.cfg.ticker = ticker.upper()
+            self._market_data_provider.reset_ticker_state()
+            self._report_provider.reset_ticker_state()
         
         # Step 1: Apply profile configuration if needed
         self._profile_manager.apply_profile_if_needed()
@@ -95,6 +94,15 @@ class TickerResearchAgent(Agent):
         # Step 2: Fetch market data
         self._step("Fetching market data")
         self._market_data = self._market_data_provider.fetch_market_data()
+        market_df = self._market_data.get("dataframe") if isinstance(self._market_data, dict) else self._market_data
+        
+        # Nothing to score or recommend: skip search, scoring and the report (LLM) call
+        if (market_df is None or market_df.empty) and not self.cfg.enable_trading_signals:
+            self._step("No market data and trading signals disabled - skipping analysis")
+            self._raw_results = []
+            self._quantitative_scores = {}
+            self._trading_signal = None
+            return self._build_result(market_df, None, error="no market data")
         
         # Step 3: Build and execute search queries
         self._step("Building search queries")
@@ -105,7 +113,6 @@ class TickerResearchAgent(Agent):
         
         # Step 4: Compute quantitative scores
         self._step("Computing quantitative analysis")
-        market_df = self._market_data.get("dataframe") if isinstance(self._market_data, dict) else self._market_data
         self._quantitative_scores = self._score_provider.calculate_all_scores(
             market_df, self._raw_results
         )
@@ -138,18 +145,23 @@ class TickerResearchAgent(Agent):
         
         self._step("Research workflow complete")
         
-        # Return comprehensive results
-        return {
-            "ticker": self.cfg.ticker.upper(),
+        return self._build_result(market_df, report_text)
+
+    def _build_result(self, market_df: Optional[Any], report_text: Optional[str], **extra: Any) -> Dict[str, Any]:
+        """Assemble the execute() result from the state of the last run."""
+        result = {
+            "ticker": self.cfg.ticker,
             "profile": self.cfg.trading_frequency,
             "lookback_days": self.cfg.lookback_days,
             "results_count": len(self._raw_results),
             "quantitative_scores": self._quantitative_scores,
             "trading_signal": self._trading_signal,
             "market_data_available": market_df is not None and not market_df.empty,
-            "sources": self._raw_results,
+            "sources": [r.to_dict() for r in self._raw_results],
             "full_report": report_text,
         }
+        result.update(extra)
+        return result
 
     # ---------------------- Convenience methods ---------------------- #
     def get_last_summary(self) -> Optional[str]:
@@ -158,16 +170,42 @@ class TickerResearchAgent(Agent):
 
     def get_sources(self) -> List[Dict[str, Any]]:
         """Get the raw search results from last execution."""
-        return list(self._raw_results)
+        return [r.to_dict() for r in self._raw_results]
 
     def get_trading_recommendation(self) -> Optional[Dict[str, Any]]:
         """Get the trading signal from last execution."""
         return self._trading_signal
 
 
+def research_tickers(tickers: List[str], max_workers: int = 4, **config_kwargs: Any) -> List[Dict[str, Any]]:
+    """Research several tickers concurrently, one agent per ticker.
+    
+    The work is I/O bound (search, market data, LLM), so threads are used;
+    ``max_workers`` also bounds concurrent OpenAI/DDGS traffic. Results come
+    back in input order; a ticker that fails yields ``{"ticker", "error"}``.
+    """
+    config_kwargs.setdefault("name", "ticker-researcher")
+    
+    def run(ticker: str) -> Dict[str, Any]:
+        try:
+            agent = TickerResearchAgent(TickerResearchConfig(ticker=ticker, **config_kwargs))
+            agent.initialize()
+            return agent.execute()
+        except Exception as exc:
+            # ``ticker`` may be what failed validation (None, a number, ...)
+            label = ticker.upper() if isinstance(ticker, str) else ticker
+            return {"ticker": label, "error": str(exc)}
+    
+    if not tickers:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers))) as pool:
+        return list(pool.map(run, tickers))
+
+
 __all__ = [
     "TickerResearchAgent",
     "TickerResearchConfig",
+    "research_tickers",
 ]
 
 
@@ -1,10 +1,60 @@
 """Scoring and trading signal generation for ticker research."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
+import hashlib
+import json
 import logging
+import os
+import threading
 
+import numpy as np
+
+from agentic_lab.utils.cache import TTLCache
 from .config import TickerResearchConfig
+from .search import SearchResult
+
+# GPT sentiment scores keyed by a digest of the full prompt; news sentiment is
+# stable enough within a day that re-asking only costs latency and tokens.
+_SENTIMENT_CACHE = TTLCache(maxsize=256, ttl=24 * 3600)
+
+# Process-wide OpenAI client (it owns an HTTP connection pool), rebuilt only
+# when OPENAI_API_KEY changes.
+_OPENAI_CLIENT: Optional[Any] = None
+_OPENAI_CLIENT_KEY: Optional[str] = None
+_OPENAI_LOCK = threading.Lock()
+
+# Per-result truncation for the sentiment prompt; with at most 10 results this
+# bounds the content at roughly 1.1k tokens.
+_TITLE_CHARS = 120
+_SNIPPET_CHARS = 300
+
+# Columns read by technical_score; only their last values are needed.
+_TECHNICAL_COLUMNS = ("Close", "SMA_20", "RSI", "MACD", "MACD_Signal")
+
+# Composite score multiplier per risk tolerance
+_RISK_MULTIPLIERS: Dict[str, float] = {
+    "conservative": 0.85,
+    "moderate": 1.0,
+    "aggressive": 1.15,
+}
+
+# Structured-output schema for the sentiment call; the API guarantees the reply
+# parses to {"score": <int 0-100>}.
+_SENTIMENT_RESPONSE_FORMAT: Dict[str, Any] = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "sentiment_score",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {"score": {"type": "integer", "minimum": 0, "maximum": 100}},
+            "required": ["score"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 
 class ScoreProvider:
@@ -19,7 +69,14 @@ class ScoreProvider:
         if df is None or df.empty:
             return 0.5
         
-        row = df.iloc[-1]
+        # Scalar reads straight from the column arrays (no row Series built);
+        # a NaN last value (indicator still warming up) counts as missing.
+        row = {}
+        for c in _TECHNICAL_COLUMNS:
+            if c in df.columns:
+                value = df[c].to_numpy()[-1]
+                if not np.isnan(value):
+                    row[c] = value
         score_components = []
         
         # RSI scoring (0-100 -> normalized)
@@ -54,37 +111,36 @@ class ScoreProvider:
         final_score = weighted_sum / total_weight if total_weight > 0 else 0.5
         return max(0.0, min(1.0, final_score))
     
-    def _rsi_score_normalized(self, rsi: float) -> float:
-        """Convert RSI to normalized score (0-1) - more sensitive to extremes."""
-        if rsi <= 25:
-            return 0.9  # Very oversold = strong buy signal
-        elif rsi <= 30:
-            return 0.75  # Oversold = buy opportunity
-        elif rsi >= 75:
-            return 0.15  # Very overbought = strong sell signal
-        elif rsi >= 70:
-            return 0.25  # Overbought = sell signal
-        else:
+    def _rsi_score_normalized(self, rsi: Any) -> Any:
+        """Convert RSI to normalized score (0-1) - more sensitive to extremes.
+        
+        Accepts a scalar (returns float) or an array of RSI values (returns array).
+        """
+        rsi = np.asarray(rsi, dtype=float)
+        score = np.select(
+            [rsi <= 25, rsi <= 30, rsi >= 75, rsi >= 70],
+            # Very oversold, oversold, very overbought, overbought
+            [0.9, 0.75, 0.15, 0.25],
             # More aggressive scaling in the middle range
-            return 0.75 - (rsi - 30) * 0.5 / 40
+            default=0.75 - (rsi - 30) * 0.5 / 40,
+        )
+        return float(score) if score.ndim == 0 else score
     
     def momentum_score(self, df: Optional[Any]) -> float:
         """Compute momentum score based on price movement (0-1)."""
-        if df is None or len(df) < 2:
+        if df is None or len(df) < 2 or "Close" not in df.columns:
             return 0.5
         
-        recent_price = df.iloc[-1].get("Close")
-        older_price = df.iloc[-min(5, len(df))].get("Close")
-        
-        if recent_price is None or older_price is None:
-            return 0.5
+        close = df["Close"].to_numpy()
+        recent_price = close[-1]
+        older_price = close[-min(5, len(close))]
         
         pct_change = (recent_price - older_price) / older_price
         # More aggressive scaling: -15% = 0, +15% = 1, 0% = 0.5
         momentum = 0.5 + (pct_change * 3.33)
-        return max(0.0, min(1.0, momentum))
+        return float(max(0.0, min(1.0, momentum)))
     
-    def sentiment_score(self, search_results: List[Dict[str, Any]]) -> float:
+    def sentiment_score(self, search_results: List[SearchResult]) -> float:
         """Compute sentiment score using GPT analysis of search results (0-1)."""
         if not search_results:
             return 0.5
@@ -97,27 +153,19 @@ class ScoreProvider:
             # Return neutral sentiment (0.5) when GPT is unavailable
             return 0.5
     
-    def _gpt_sentiment_analysis(self, search_results: List[Dict[str, Any]]) -> float:
+    def _gpt_sentiment_analysis(self, search_results: List[SearchResult]) -> float:
         """Use GPT to analyze sentiment from search results."""
-        import os
-        
-        # Check if OpenAI API key is available
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise Exception("OpenAI API key not available")
-        
-        try:
-            from openai import OpenAI
-        except ImportError:
-            raise Exception("OpenAI package not installed")
-        
-        client = OpenAI(api_key=api_key)
-        
-        # Prepare text for analysis (limit to top 10 results to avoid token limits)
+        # Prepare text for analysis (top 10 results, truncated, syndicated copies dropped)
         texts = []
+        seen_snippets = set()
         for result in search_results[:10]:
-            title = result.get("title", "")
-            snippet = result.get("snippet", "")
+            title = (result.title or "")[:_TITLE_CHARS]
+            snippet = (result.snippet or "")[:_SNIPPET_CHARS]
+            if snippet:
+                key = snippet[:80]
+                if key in seen_snippets:
+                    continue
+                seen_snippets.add(key)
             if title or snippet:
                 texts.append(f"Title: {title}\nContent: {snippet}")
         
@@ -126,7 +174,7 @@ class ScoreProvider:
         
         combined_text = "\n\n---\n\n".join(texts)
         
-        prompt = f"""Analyze the sentiment of the following news articles and content about stock ticker {self.config.ticker.upper()}.
+        prompt = f"""Analyze the sentiment of the following news articles and content about stock ticker {self.config.ticker}.
 
 Rate the overall sentiment on a scale from 0 to 100 where:
 - 0-20: Very Bearish (strong sell signals, major negative news)
@@ -145,23 +193,31 @@ Focus on:
 Content to analyze:
 {combined_text}
 
-Respond with ONLY the numerical score (0-100), no explanation."""
+Respond with the score (0-100) as {{"score": <integer>}}, no explanation."""
 
+        cache_key = hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+        cached = _SENTIMENT_CACHE.get(cache_key)
+        if cached is not None:
+            self.logger.info(f"GPT sentiment analysis (cached): {cached:.2f}")
+            return float(cached)
+        
+        client = _get_openai_client()  # only needed on a cache miss
         try:
             response = client.chat.completions.create(
                 model="gpt-4o-mini",
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-                temperature=0.1  # Low temperature for consistent scoring
+                max_tokens=20,
+                temperature=0,  # Deterministic scoring (and better cache reuse)
+                response_format=_SENTIMENT_RESPONSE_FORMAT,
             )
             
-            score_text = response.choices[0].message.content.strip()
-            score = float(score_text)
+            score = float(json.loads(response.choices[0].message.content)["score"])
             
             # Normalize from 0-100 to 0-1
             normalized_score = max(0.0, min(1.0, score / 100.0))
             
             self.logger.info(f"GPT sentiment analysis: {score}/100 -> {normalized_score:.2f}")
+            _SENTIMENT_CACHE.set(cache_key, normalized_score)
             return normalized_score
             
         except Exception as e:
@@ -268,20 +324,21 @@ Respond with ONLY the numerical score (0-100), no explanation."""
     def calculate_all_scores(
         self,
         df: Optional[Any],
-        search_results: List[Dict[str, Any]],
+        search_results: List[SearchResult],
     ) -> Dict[str, float]:
-        """Calculate all scoring components."""
-        technical = self.technical_score(df)
-        momentum = self.momentum_score(df)
-        sentiment = self.sentiment_score(search_results)
+        """Calculate all scoring components.
+        
+        The sentiment call (a network round trip) runs in the background while
+        the local technical/momentum scores are computed.
+        """
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            sentiment_future = pool.submit(self.sentiment_score, search_results)
+            technical = self.technical_score(df)
+            momentum = self.momentum_score(df)
+            sentiment = sentiment_future.result()
         
         # Risk adjustment based on profile
-        risk_multipliers = {
-            "conservative": 0.85,
-            "moderate": 1.0,
-            "aggressive": 1.15,
-        }
-        risk_adjustment = risk_multipliers.get(self.config.risk_tolerance.lower(), 1.0)
+        risk_adjustment = _RISK_MULTIPLIERS.get(self.config.risk_tolerance.lower(), 1.0)
         
         composite = self.composite_score(technical, momentum, sentiment, risk_adjustment)
         
@@ -291,6 +348,55 @@ Respond with ONLY the numerical score (0-100), no explanation."""
             "sentiment": sentiment,
             "composite": composite,
         }
+    
+    def score_history(self, df: Any, sentiment: float = 0.5) -> Dict[str, np.ndarray]:
+        """Technical, momentum and composite scores for every bar of ``df``.
+        
+        Array counterpart of ``calculate_all_scores`` for backtests; a single
+        ``sentiment`` value is applied to all bars.
+        """
+        # Imported here: the module JIT-compiles with numba when installed.
+        from .scoring_vectorized import composite_score_arr, momentum_score_arr, technical_score_arr
+        
+        n = len(df)
+        
+        def column(name: str) -> np.ndarray:
+            if name not in df.columns:
+                return np.full(n, np.nan)
+            return np.ascontiguousarray(df[name].to_numpy(dtype=np.float64))
+        
+        technical = technical_score_arr(
+            column("RSI"), column("Close"), column("SMA_20"), column("MACD"), column("MACD_Signal")
+        )
+        momentum = momentum_score_arr(column("Close"))
+        risk_adjustment = _RISK_MULTIPLIERS.get(self.config.risk_tolerance.lower(), 1.0)
+        composite = composite_score_arr(technical, momentum, np.full(n, float(sentiment)), risk_adjustment)
+        
+        return {
+            "technical": technical,
+            "momentum": momentum,
+            "composite": composite,
+        }
+
+
+def _get_openai_client() -> Any:
+    """Return the shared OpenAI client for ``OPENAI_API_KEY``, creating it on first use."""
+    global _OPENAI_CLIENT, _OPENAI_CLIENT_KEY
+    
+    # Check if OpenAI API key is available
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise Exception("OpenAI API key not available")
+    
+    with _OPENAI_LOCK:
+        if _OPENAI_CLIENT is None or _OPENAI_CLIENT_KEY != api_key:
+            try:
+                from openai import OpenAI
+            except ImportError:
+                raise Exception("OpenAI package not installed")
+            _OPENAI_CLIENT = OpenAI(api_key=api_key)
+            _OPENAI_CLIENT_KEY = api_key
+        return _OPENAI_CLIENT
 
 
 __all__ = ["ScoreProvider"]
\ No newline at end of file
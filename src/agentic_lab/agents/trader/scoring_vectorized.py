@@ -0,0 +1,99 @@
+"""Array versions of the ScoreProvider scores, one value per bar.
+
+These mirror ``ScoreProvider.technical_score`` / ``momentum_score`` /
+``composite_score`` but take whole indicator columns, for walk-forward
+backtests where calling the scalar methods bar by bar would dominate.
+A NaN input (e.g. RSI during warm-up) drops that component, as a missing
+column or a NaN last value does in the scalar path.
+
+The kernels are plain NumPy array expressions; when numba is installed they
+are JIT-compiled (and cached on disk) as well.
+"""
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover - optional
+    njit = None  # type: ignore
+
+
+def _jit(func: Callable[..., np.ndarray]) -> Callable[..., np.ndarray]:
+    """Compile ``func`` with numba when available, otherwise return it as-is."""
+    if njit is None:
+        return func
+    compiled: Callable[..., np.ndarray] = njit(cache=True)(func)
+    return compiled
+
+
+@_jit
+def rsi_score_arr(rsi: np.ndarray) -> np.ndarray:
+    """Vectorized ``ScoreProvider._rsi_score_normalized``."""
+    mid = 0.75 - (rsi - 30.0) * 0.5 / 40.0
+    overbought = np.where(rsi >= 75.0, 0.15, np.where(rsi >= 70.0, 0.25, mid))
+    return np.where(rsi <= 25.0, 0.9, np.where(rsi <= 30.0, 0.75, overbought))
+
+
+@_jit
+def technical_score_arr(
+    rsi: np.ndarray,
+    close: np.ndarray,
+    sma20: np.ndarray,
+    macd: np.ndarray,
+    macd_sig: np.ndarray,
+) -> np.ndarray:
+    """Weighted RSI / price-vs-SMA / MACD score (0-1) for every bar."""
+    has_rsi = ~np.isnan(rsi)
+    has_sma = ~(np.isnan(close) | np.isnan(sma20))
+    has_macd = ~(np.isnan(macd) | np.isnan(macd_sig))
+    
+    price_sma = (np.minimum(np.maximum(close / sma20, 0.7), 1.3) - 0.7) / 0.6
+    macd_score = np.where(macd > macd_sig, 1.0, 0.3)
+    
+    weighted = (np.where(has_rsi, 0.4 * rsi_score_arr(rsi), 0.0)
+                + np.where(has_sma, 0.4 * price_sma, 0.0)
+                + np.where(has_macd, 0.2 * macd_score, 0.0))
+    total_weight = 0.4 * has_rsi + 0.4 * has_sma + 0.2 * has_macd
+    present = total_weight > 0
+    score = np.where(present, weighted / np.where(present, total_weight, 1.0), 0.5)
+    return np.minimum(np.maximum(score, 0.0), 1.0)
+
+
+@_jit
+def momentum_score_arr(close: np.ndarray) -> np.ndarray:
+    """Momentum score (0-1) from the change versus up to 4 bars earlier."""
+    n = close.shape[0]
+    older = close[np.maximum(np.arange(n) - 4, 0)]
+    momentum: np.ndarray = np.minimum(np.maximum(0.5 + (close - older) / older * 3.33, 0.0), 1.0)
+    if n > 0:
+        momentum[0] = 0.5  # a single bar has no momentum
+    return momentum
+
+
+@_jit
+def composite_score_arr(
+    technical: np.ndarray,
+    momentum: np.ndarray,
+    sentiment: np.ndarray,
+    risk_adjustment: float,
+) -> np.ndarray:
+    """Vectorized ``ScoreProvider.composite_score``."""
+    use_sentiment = np.abs(sentiment - 0.5) > 0.01
+    weak = (technical < 0.5) & (momentum < 0.4)
+    with_sentiment = (np.where(weak, 0.45, 0.4) * technical
+                      + np.where(weak, 0.35, 0.3) * momentum
+                      + np.where(weak, 0.20, 0.3) * sentiment)
+    without_sentiment = 0.6 * technical + 0.4 * momentum
+    composite = np.where(use_sentiment, with_sentiment, without_sentiment) * risk_adjustment
+    return np.minimum(np.maximum(composite, 0.0), 1.0)
+
+
+__all__ = [
+    "rsi_score_arr",
+    "technical_score_arr",
+    "momentum_score_arr",
+    "composite_score_arr",
+]
@@ -1,18 +1,136 @@
 """Web search functionality for ticker research."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Tuple
-import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
 import logging
+import threading
+import time
 
 try:
-    from ddgs import DDGS  # type: ignore
+    from pybloom_live import BloomFilter  # type: ignore
 except Exception:  # pragma: no cover - optional
-    DDGS = None  # type: ignore
+    BloomFilter = None  # type: ignore
 
 from agentic_lab.core.exceptions import AgentError
+from agentic_lab.utils.cache import TTLCache
 from .config import TickerResearchConfig
 
+# ddgs is imported on first use (see _ddgs_backend); None until then or when
+# it is not installed.
+DDGS: Any = None
+_DDGS_PROBED = False
+
+# Upper bound on DDGS requests in flight for a single search() call; keeps the
+# fan-out polite without serializing the queries.
+_MAX_CONCURRENT_QUERIES = 4
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: bursts up to ``capacity``, then ``rate`` per second."""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Take one token, sleeping only as long as the bucket is in deficit."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1  # reserve; a negative balance is the wait owed
+            wait = -self._tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+@dataclass(slots=True, frozen=True)
+class SearchResult:
+    """A single web search hit."""
+    
+    query: str
+    category: str
+    title: Optional[str]
+    snippet: Optional[str]
+    url: Optional[str]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+_UNSET = object()
+
+
+# Searches asking for more results than this dedup URLs with a Bloom filter
+# (when pybloom-live is installed) instead of an exact set. At its 1% error
+# rate the filter may occasionally report an unseen URL as seen, dropping a
+# unique result; it never lets a repeat through.
+_BLOOM_MIN_RESULTS = 200
+
+
+def _url_filter(max_results: int) -> Any:
+    """Return an exact set, or a Bloom filter for very wide searches."""
+    if BloomFilter is not None and max_results > _BLOOM_MIN_RESULTS:
+        return BloomFilter(capacity=max_results * 10, error_rate=0.01)
+    return set()
+
+
+# Paces outgoing DDGS requests (cache hits are free) at ~4 per second overall.
+_QUERY_LIMITER = _TokenBucket(rate=4.0, capacity=_MAX_CONCURRENT_QUERIES)
+
+# Raw items per (backend class, query, timelimit, region, safesearch); results
+# are filtered per call, so a different max_results still works on a hit.
+_QUERY_CACHE = TTLCache(maxsize=1024, ttl=600)
+
+# One long-lived client per backend class. DDGS keeps its HTTP clients on the
+# instance, so sharing it keeps connections (and TLS sessions) warm across
+# queries, providers and agents.
+_SESSIONS: Dict[Any, Any] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def _get_session(backend: Any) -> Any:
+    """Return the process-wide instance of ``backend``, creating it on first use."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(backend)
+        if session is None:
+            session = _SESSIONS[backend] = backend()
+        return session
+
+
+def _ddgs_backend() -> Any:
+    """Import ddgs on first call; returns the DDGS class, or None if not installed."""
+    global DDGS, _DDGS_PROBED
+    if DDGS is None and not _DDGS_PROBED:
+        _DDGS_PROBED = True
+        try:
+            from ddgs import DDGS as backend  # type: ignore
+        except Exception:  # pragma: no cover - optional
+            backend = None
+        DDGS = backend
+    return DDGS
+
+
+# (category, query template) pairs; formatted with ``base`` (ticker) and
+# ``horizon`` (date range label) in build_queries.
+_QUERY_TEMPLATES: Tuple[Tuple[str, str], ...] = (
+    ("news", "{base} stock news {horizon}"),
+    ("catalysts", "{base} guidance update {horizon}"),
+    ("sentiment", "{base} analyst rating sentiment {horizon}"),
+    ("macro", "{base} sector impact macro {horizon}"),
+)
+_FINANCIAL_TEMPLATES: Tuple[Tuple[str, str], ...] = (
+    ("fundamentals", "{base} earnings results {horizon}"),
+    ("fundamentals", "{base} revenue growth {horizon}"),
+    ("risk", "{base} litigation risk {horizon}"),
+)
+_ALL_TEMPLATES = _QUERY_TEMPLATES + _FINANCIAL_TEMPLATES
+
 
 class SearchProvider:
     """Handles web search functionality for ticker research."""
@@ -20,7 +138,18 @@ class SearchProvider:
     def __init__(self, config: TickerResearchConfig, logger: logging.Logger):
         self.config = config
         self.logger = logger
-        self._search_backend = DDGS if DDGS else None
+        self._backend: Any = _UNSET
+    
+    @property
+    def _search_backend(self) -> Any:
+        """Search client class (DDGS by default), resolved on first use."""
+        if self._backend is _UNSET:
+            self._backend = _ddgs_backend()
+        return self._backend
+    
+    @_search_backend.setter
+    def _search_backend(self, backend: Any) -> None:
+        self._backend = backend
     
     def timelimit_token(self) -> str:
         """Convert lookback days to search timelimit token."""
@@ -39,67 +168,76 @@ class SearchProvider:
     
     def build_queries(self) -> List[Tuple[str, str]]:
         """Build categorized search queries based on config."""
-        base = self.config.ticker.upper()
+        base = self.config.ticker
         horizon = self.date_range_label()
-        queries: List[Tuple[str, str]] = [
-            ("news", f"{base} stock news {horizon}"),
-            ("catalysts", f"{base} guidance update {horizon}"),
-            ("sentiment", f"{base} analyst rating sentiment {horizon}"),
-            ("macro", f"{base} sector impact macro {horizon}"),
-        ]
-        
-        if self.config.include_financial_terms:
-            queries.extend([
-                ("fundamentals", f"{base} earnings results {horizon}"),
-                ("fundamentals", f"{base} revenue growth {horizon}"),
-                ("risk", f"{base} litigation risk {horizon}"),
-            ])
+        templates = _ALL_TEMPLATES if self.config.include_financial_terms else _QUERY_TEMPLATES
         
         # Deduplicate by text while keeping first category
-        seen = set()
-        dedup: List[Tuple[str, str]] = []
-        for cat, q in queries:
-            if q not in seen:
-                seen.add(q)
-                dedup.append((cat, q))
-        return dedup
+        dedup: Dict[str, str] = {}
+        for cat, template in templates:
+            dedup.setdefault(template.format(base=base, horizon=horizon), cat)
+        return [(cat, q) for q, cat in dedup.items()]
     
-    def search(self, queries: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
-        """Execute web search across query categories."""
+    def _run_one_query(self, ddgs: Any, category: str, q: str, timelimit: str) -> List[SearchResult]:
+        """Run a single query and normalize all its hits (no dedup or truncation)."""
+        self.logger.debug(f"Query '{q}' (category={category})")
+        key = (type(ddgs), q, timelimit, "wt-wt", "moderate")
+        items = _QUERY_CACHE.get(key)
+        if items is None:
+            _QUERY_LIMITER.acquire()
+            items = list(ddgs.text(q, region="wt-wt", safesearch="moderate", timelimit=timelimit))
+            _QUERY_CACHE.set(key, items)
+        
+        return [
+            SearchResult(
+                query=q,
+                category=category,
+                title=item.get("title"),
+                snippet=item.get("body") or item.get("description"),
+                url=item.get("href") or item.get("url"),
+            )
+            for item in items
+        ]
+    
+    def search(self, queries: List[Tuple[str, str]]) -> List[SearchResult]:
+        """Execute web search across query categories.
+        
+        Queries run concurrently (each is a blocking HTTP call); hits are merged
+        in query order so deduplication and truncation match a serial run.
+        """
         if not self._search_backend:
             raise AgentError("ddgs not installed. Install with agentic-lab[research]")
         
-        ddgs = self._search_backend()
-        results: List[Dict[str, Any]] = []
-        seen_urls = set()
+        ddgs = _get_session(self._search_backend)
+        results: List[SearchResult] = []
+        seen_urls = _url_filter(self.config.max_results)
         timelimit = self.timelimit_token()
         
         self.logger.info(f"Starting search across {len(queries)} query variants (timelimit token '{timelimit}')")
+        if not queries:
+            return results
         
-        for category, q in queries:
-            self.logger.debug(f"Query '{q}' (category={category})")
+        with ThreadPoolExecutor(max_workers=min(len(queries), _MAX_CONCURRENT_QUERIES)) as pool:
+            futures = [pool.submit(self._run_one_query, ddgs, category, q, timelimit) for category, q in queries]
             try:
-                for item in ddgs.text(q, region="wt-wt", safesearch="moderate", timelimit=timelimit):
+                for future in futures:
+                    for hit in future.result():
+                        if len(results) >= self.config.max_results:
+                            break
+                        url = hit.url
+                        if url:
+                            if url in seen_urls:
+                                continue
+                            seen_urls.add(url)
+                        results.append(hit)
                     if len(results) >= self.config.max_results:
                         break
-                    url = item.get("href") or item.get("url")
-                    if url and url in seen_urls:
-                        continue
-                    seen_urls.add(url)
-                    results.append({
-                        "query": q,
-                        "category": category,
-                        "title": item.get("title"),
-                        "snippet": item.get("body") or item.get("description"),
-                        "url": url,
-                    })
-                if len(results) >= self.config.max_results:
-                    break
-            finally:  # polite pacing between queries
-                time.sleep(0.25)
+            finally:
+                for future in futures:
+                    future.cancel()
         
         self.logger.info(f"Search complete – gathered {len(results)} unique sources")
         return results
 
 
-__all__ = ["SearchProvider"]
\ No newline at end of file
+__all__ = ["SearchProvider", "SearchResult"]
\ No newline at end of file
@@ -0,0 +1,391 @@
+"""
+Compiled loops backing the indicator functions in ``analyzer``.
+
+numba is optional. Without it ``_jit`` is a no-op decorator and
+``ACCELERATED`` is False; ``analyzer`` then takes its NumPy/pandas paths
+instead of calling these loops as plain Python.
+
+Kernels are pinned to the explicit signatures in ``SIGNATURES`` but compiled
+lazily: ``ensure_compiled`` builds them (cached on disk) the first time a
+dtype reaches the kernels, so importing this module compiles nothing.
+Callers pass C-contiguous float64 or float32 arrays of a single dtype, which
+``analyzer._to_dtype`` guarantees for inputs (possibly read-only views of the
+caller's data); output buffers are freshly allocated with the same dtype.
+``DTYPES`` lists the array dtypes the current kernels accept.
+
+If the ahead-of-time extension ``_ta_kernels`` has been built (see
+``_kernels_build``), its precompiled versions replace the kernels listed in
+``AOT_SIGNATURES`` at import, so no JIT warm-up is paid (and numba is not
+needed at runtime). The extension is float64-only, so loading it leaves
+float32 inputs to the NumPy paths. Rebuild it after changing any of these
+loops.
+``rsi_batch`` runs its rows in parallel threads and is JIT-only: the AOT
+compiler cannot build parallel loops.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Set, TypeVar
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover - optional
+    njit = None
+    prange = range
+
+ACCELERATED = njit is not None
+DTYPES = frozenset({np.dtype(np.float64), np.dtype(np.float32)})
+
+# Pinned float64 signatures of the kernels: ``ensure_compiled`` compiles exactly
+# these (or their float32 twins, see ``_signature``) and the ahead-of-time build
+# exports them. Inputs are typed read-only so that zero-copy views of read-only
+# buffers (e.g. copy-on-write pandas Series) match too; writable arrays convert.
+_IN = "Array(f8, 1, 'C', readonly=True)"
+_IN2D = "Array(f8, 2, 'C', readonly=True)"
+SIGNATURES = {
+    "obv": f"void({_IN}, {_IN}, f8[::1])",
+    "rolling_mean": f"void({_IN}, i8, f8[::1])",
+    "bollinger": f"void({_IN}, i8, f8, f8[::1], f8[::1], f8[::1])",
+    "macd": f"void({_IN}, f8, f8, f8, f8[::1], f8[::1], f8[::1])",
+    "_rsi_value": "f8(f8, f8)",
+    "rsi": f"void({_IN}, i8, f8[::1])",
+    "stochastic": f"void({_IN}, {_IN}, {_IN}, i8, i8, f8[::1], f8[::1])",
+    "ewma": f"void({_IN}, f8, f8[::1])",
+    "rsi_batch": f"void({_IN2D}, i8, f8[:, ::1])",
+    "all_finite": f"b1({_IN})",
+}
+
+
+# Kernels exported by the ahead-of-time build (see ``_kernels_build``);
+# helpers and parallel kernels are left to the JIT.
+AOT_SIGNATURES = {
+    name: sig
+    for name, sig in SIGNATURES.items()
+    if not name.startswith("_") and name != "rsi_batch"
+}
+
+# Shared options: no bounds checks (all indices are loop-derived) and NumPy
+# float semantics (x / 0 -> inf/nan instead of raising). Running sums are
+# float64 literals, so float32 kernels still accumulate in double precision.
+_OPTIONS = dict(cache=True, boundscheck=False, error_model="numpy")
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _jit(**options: Any) -> Callable[[_F], _F]:
+    """``numba.njit`` with ``_OPTIONS`` (plus ``options``); a no-op without numba."""
+
+    def decorate(func: _F) -> _F:
+        if njit is None:
+            return func
+        compiled: _F = njit(**_OPTIONS, **options)(func)
+        return compiled
+
+    return decorate
+
+
+@_jit(fastmath={"reassoc"})
+def all_finite(x: np.ndarray) -> bool:
+    """
+    True when ``x`` holds no NaN or infinity.
+
+    ``v * 0`` is 0 for finite ``v`` and NaN otherwise, so the sum stays 0
+    exactly when every value is finite; a branch-free reduction that LLVM
+    vectorizes (about 1.8x faster than an early-exit loop on 1M values).
+    """
+    s = 0.0
+    for i in range(x.shape[0]):
+        s += x[i] * 0.0
+    return s == 0.0
+
+
+@_jit(fastmath=True)
+def obv(close: np.ndarray, volume: np.ndarray, out: np.ndarray) -> None:
+    """On-balance volume of ``close``/``volume`` written into ``out``."""
+    out[0] = 0.0
+    for i in range(1, close.shape[0]):
+        d = close[i] - close[i - 1]
+        if d > 0:
+            out[i] = out[i - 1] + volume[i]
+        elif d < 0:
+            out[i] = out[i - 1] - volume[i]
+        else:
+            out[i] = out[i - 1]
+
+
+@_jit()
+def rolling_mean(x: np.ndarray, window: int, out: np.ndarray) -> None:
+    """Trailing ``window`` mean of ``x`` into ``out`` (NaN until the window fills)."""
+    n = x.shape[0]
+    s = 0.0
+    for i in range(n):
+        s += x[i]
+        if i >= window:
+            s -= x[i - window]
+        out[i] = s / window if i >= window - 1 else np.nan
+
+
+@_jit()
+def bollinger(
+    x: np.ndarray,
+    window: int,
+    num_std_dev: float,
+    upper_out: np.ndarray,
+    middle_out: np.ndarray,
+    lower_out: np.ndarray,
+) -> None:
+    """
+    Bollinger bands (trailing mean +/- k sample std) of ``x`` in one pass.
+
+    The window is slid with a Welford-style add/remove update rather than
+    running sums of squares, which cancel badly for prices with small spread;
+    near-flat windows are recomputed directly so a flat window has width 0.
+    """
+    n = x.shape[0]
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        if i < window:
+            delta = x[i] - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x[i] - mean)
+        else:
+            leaving = x[i - window]
+            old_mean = mean
+            mean += (x[i] - leaving) / window
+            m2 += (x[i] - leaving) * (x[i] - mean + leaving - old_mean)
+            if m2 < 1e-9 * mean * mean * window:
+                # Near-flat window: the add/remove updates leave a residual of
+                # the order of eps * mean**2 (a visibly nonzero band on a flat
+                # window), so recompute both moments from deviations to the
+                # window's first value, which are exactly 0 when it is flat.
+                start = i - window + 1
+                shift = 0.0
+                for j in range(start, i + 1):
+                    shift += x[j] - x[start]
+                shift /= window
+                mean = x[start] + shift
+                m2 = 0.0
+                for j in range(start, i + 1):
+                    d = x[j] - x[start] - shift
+                    m2 += d * d
+        if i >= window - 1:
+            band = num_std_dev * np.sqrt(max(m2, 0.0) / (window - 1)) if window > 1 else np.nan
+            upper_out[i] = mean + band
+            middle_out[i] = mean
+            lower_out[i] = mean - band
+        else:
+            upper_out[i] = np.nan
+            middle_out[i] = np.nan
+            lower_out[i] = np.nan
+
+
+@_jit()
+def macd(
+    x: np.ndarray,
+    fast_alpha: float,
+    slow_alpha: float,
+    signal_alpha: float,
+    macd_out: np.ndarray,
+    signal_out: np.ndarray,
+    hist_out: np.ndarray,
+) -> None:
+    """Fast/slow/signal EMAs (seeded with the first value) fused into one pass."""
+    n = x.shape[0]
+    if n == 0:
+        return
+    fast = x[0]
+    slow = x[0]
+    signal = 0.0
+    for i in range(n):
+        fast += fast_alpha * (x[i] - fast)
+        slow += slow_alpha * (x[i] - slow)
+        m = fast - slow
+        if i == 0:
+            signal = m
+        else:
+            signal += signal_alpha * (m - signal)
+        macd_out[i] = m
+        signal_out[i] = signal
+        hist_out[i] = m - signal
+
+
+@_jit()
+def _rsi_value(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0.0:
+        return 100.0 if avg_gain > 0.0 else 50.0
+    return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+@_jit()
+def rsi(x: np.ndarray, window: int, out: np.ndarray) -> None:
+    """
+    Wilder RSI of ``x`` into ``out``; entries before ``window`` are left as-is.
+
+    Average gain/loss are seeded with the mean of the first ``window`` changes
+    and then smoothed recursively.
+    """
+    n = x.shape[0]
+    if n <= window:
+        return
+    gain = 0.0
+    loss = 0.0
+    for i in range(1, window + 1):
+        d = x[i] - x[i - 1]
+        if d > 0:
+            gain += d
+        else:
+            loss -= d
+    gain /= window
+    loss /= window
+    out[window] = _rsi_value(gain, loss)
+    for i in range(window + 1, n):
+        d = x[i] - x[i - 1]
+        gain = (gain * (window - 1) + (d if d > 0 else 0.0)) / window
+        loss = (loss * (window - 1) + (-d if d < 0 else 0.0)) / window
+        out[i] = _rsi_value(gain, loss)
+
+
+# JIT ``rsi`` for ``rsi_batch``: the AOT build rebinds the module's ``rsi`` to a
+# compiled builtin, which numba cannot call from another kernel.
+_rsi_jit = rsi
+
+
+@_jit()
+def stochastic(
+    high: np.ndarray,
+    low: np.ndarray,
+    close: np.ndarray,
+    window: int,
+    k_smoothing: int,
+    k_out: np.ndarray,
+    d_out: np.ndarray,
+) -> None:
+    """
+    Stochastic %K/%D using monotonic deques for the rolling low/high.
+
+    %K is NaN until ``window`` bars are available and 0 when the range is flat;
+    %D is the mean of the available %K values over ``k_smoothing`` bars.
+    """
+    n = close.shape[0]
+    min_idx = np.empty(n, dtype=np.int64)  # indices with increasing lows
+    max_idx = np.empty(n, dtype=np.int64)  # indices with decreasing highs
+    min_head = min_tail = 0
+    max_head = max_tail = 0
+    k_sum = 0.0
+    k_count = 0
+    for i in range(n):
+        while min_tail > min_head and low[min_idx[min_tail - 1]] >= low[i]:
+            min_tail -= 1
+        min_idx[min_tail] = i
+        min_tail += 1
+        if min_idx[min_head] <= i - window:
+            min_head += 1
+
+        while max_tail > max_head and high[max_idx[max_tail - 1]] <= high[i]:
+            max_tail -= 1
+        max_idx[max_tail] = i
+        max_tail += 1
+        if max_idx[max_head] <= i - window:
+            max_head += 1
+
+        if i >= window - 1:
+            lowest = low[min_idx[min_head]]
+            price_range = high[max_idx[max_head]] - lowest
+            k_out[i] = 0.0 if price_range == 0 else 100.0 * (close[i] - lowest) / price_range
+            k_sum += k_out[i]
+            k_count += 1
+        else:
+            k_out[i] = np.nan
+        if i >= k_smoothing and not np.isnan(k_out[i - k_smoothing]):
+            k_sum -= k_out[i - k_smoothing]
+            k_count -= 1
+        d_out[i] = k_sum / k_count if k_count > 0 else np.nan
+
+
+@_jit()
+def ewma(x: np.ndarray, alpha: float, out: np.ndarray) -> None:
+    """
+    Recursive exponential average (pandas ``ewm(adjust=False)``) into ``out``.
+
+    Starts at the first non-NaN value (earlier entries are NaN); a NaN later
+    on repeats the previous average.
+    """
+    n = x.shape[0]
+    start = 0
+    while start < n and np.isnan(x[start]):
+        out[start] = np.nan
+        start += 1
+    if start == n:
+        return
+    avg = x[start]
+    out[start] = avg
+    for i in range(start + 1, n):
+        if not np.isnan(x[i]):
+            avg += alpha * (x[i] - avg)
+        out[i] = avg
+
+
+@_jit(parallel=True)
+def rsi_batch(x: np.ndarray, window: int, out: np.ndarray) -> None:
+    """``rsi`` of every row of ``x`` into the matching row of ``out``, rows in parallel."""
+    for j in prange(x.shape[0]):
+        _rsi_jit(x[j], window, out[j])
+
+
+# The decorated kernels, kept for the AOT build and ``ensure_compiled`` even
+# when replaced below.
+_DISPATCHERS: Dict[str, Any] = {name: globals()[name] for name in SIGNATURES}
+JIT_KERNELS = {name: _DISPATCHERS[name] for name in AOT_SIGNATURES}
+
+try:
+    from . import _ta_kernels  # type: ignore
+except ImportError:
+    _ta_kernels = None
+else:  # pragma: no cover - only with a local AOT build
+    for _name in AOT_SIGNATURES:
+        globals()[_name] = getattr(_ta_kernels, _name)
+    ACCELERATED = True
+    DTYPES = frozenset({np.dtype(np.float64)})
+
+
+_compiled: Set[np.dtype] = set()
+_compile_lock = threading.Lock()
+
+
+def _signature(name: str, dtype: np.dtype) -> str:
+    """``SIGNATURES[name]`` with its array types switched to ``dtype``."""
+    sig = SIGNATURES[name]
+    if dtype == np.float32:
+        sig = sig.replace("Array(f8", "Array(f4").replace("f8[", "f4[")
+    return sig
+
+
+def ensure_compiled(dtype: np.dtype) -> None:
+    """
+    Compiles the JIT kernels for ``dtype`` arrays from their pinned signatures.
+
+    Runs once per dtype, on the first kernel call with it (see
+    ``analyzer._use_kernels``), so importing compiles nothing and float32
+    versions exist only once float32 is used. The dispatchers are then closed
+    to new specializations: a stray argument type raises ``TypeError`` instead
+    of silently compiling another version.
+    """
+    if dtype in _compiled:
+        return
+    with _compile_lock:
+        if dtype in _compiled:
+            return
+        for name in SIGNATURES:
+            kernel = _DISPATCHERS[name]
+            if not hasattr(kernel, "compile"):
+                continue  # numba missing
+            # Under the AOT build only the JIT-only kernels are called (and the
+            # JIT ``rsi`` that ``rsi_batch`` calls).
+            if _ta_kernels is not None and name in AOT_SIGNATURES and name != "rsi":
+                continue
+            kernel.disable_compile(False)
+            kernel.compile(_signature(name, dtype))
+            kernel.disable_compile(True)
+        _compiled.add(dtype)
@@ -0,0 +1,35 @@
+"""
+Ahead-of-time build of the ``_kernels`` loops into the ``_ta_kernels`` extension.
+
+Usage (requires numba and setuptools)::
+
+    python -m agentic_lab.agents.trader.stock_analysis._kernels_build
+
+The extension is written next to this file; ``_kernels`` picks it up on the
+next import, so short-lived processes skip numba's first-call compilation.
+"""
+
+import os
+from typing import Optional
+
+from numba.pycc import CC
+
+from . import _kernels
+
+
+def build(verbose: bool = False, output_dir: Optional[str] = None) -> None:
+    """
+    Compile every kernel in ``_kernels.AOT_SIGNATURES`` into ``_ta_kernels``,
+    written to ``output_dir`` (default: next to this file).
+    """
+    cc = CC("_ta_kernels")
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.verbose = verbose
+    for name, signature in _kernels.AOT_SIGNATURES.items():
+        kernel = _kernels.JIT_KERNELS[name]
+        cc.export(name, signature)(getattr(kernel, "py_func", kernel))
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build(verbose=True)
@@ -4,193 +4,477 @@ indicators for stock data. These indicators are commonly used by traders to
 analyze market trends and make decisions.
 """
 
-from typing import List, Tuple
+import warnings
+from typing import List, Sequence, Tuple, Union
+
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from . import _kernels
+
+# Accepted price/volume inputs and the indicator outputs (the ``DTYPE`` array,
+# or a list with the deprecated ``as_list=True``).
+ArrayLike = Union[Sequence[float], np.ndarray, pd.Series]
+# Inputs of the batch functions: one price series per row.
+MatrixLike = Union[np.ndarray, Sequence[Sequence[float]]]
+Indicator = Union[List[float], np.ndarray]
+
+# Floating-point type of the inputs and indicator outputs. float32 halves the
+# memory traffic; results then agree with float64 to ~1e-6 relative for the
+# averages and ~1e-4 for the stochastic oscillator (windows up to 100). Set
+# ``analyzer.DTYPE = np.float32`` to opt in; the kernels are specialized for
+# float32 on its first use, so the float64 default compiles nothing extra.
+DTYPE = np.float64
+
+# Up to this many bars, min/max over a sliding_window_view beats pandas'
+# rolling min/max, whose fixed per-call cost dominates short series; past it
+# the O(n * window) reduction loses (measured crossover ~1k bars for windows
+# of 5-128).
+_WINDOW_VIEW_MAX_BARS = 1000
+
+
+def _to_dtype(data: ArrayLike, name: str) -> np.ndarray:
+    """
+    Converts a 1-D sequence of finite numbers to a contiguous ``DTYPE`` array.
+
+    Contiguous arrays and Series already of ``DTYPE`` are used as-is (no
+    copy); the result may therefore be a read-only view of the caller's data
+    and must not be written to. Validation happens in the same C-level pass
+    as any conversion, plus one scan for NaN/inf.
 
+    Raises:
+        TypeError: If ``data`` is not a 1-D sequence of numbers.
+        ValueError: If ``data`` contains NaN or infinite values.
+    """
+    if (
+        isinstance(data, np.ndarray)
+        and data.dtype == DTYPE
+        and data.ndim == 1
+        and data.flags.c_contiguous
+    ):
+        arr = data
+    else:
+        arr = (
+            data.to_numpy(copy=False)
+            if isinstance(data, pd.Series)
+            else np.asarray(data)
+        )
+        if arr.ndim != 1 or arr.dtype.kind not in "biuf":
+            raise TypeError(f"{name} must be a list of numbers.")
+        arr = np.ascontiguousarray(arr, dtype=DTYPE)
+    _check_finite(arr, name)
+    return arr
+
+
+def _to_dtype_2d(data: MatrixLike, name: str) -> np.ndarray:
+    """
+    Converts a 2-D array-like of finite numbers (one series per row) to a
+    contiguous ``DTYPE`` array.
+
+    Raises:
+        TypeError: If ``data`` is not a 2-D array of numbers.
+        ValueError: If ``data`` contains NaN or infinite values.
+    """
+    arr = np.asarray(data)
+    if arr.ndim != 2 or arr.dtype.kind not in "biuf":
+        raise TypeError(f"{name} must be a 2-D array of numbers.")
+    arr = np.ascontiguousarray(arr, dtype=DTYPE)
+    _check_finite(arr, name)
+    return arr
 
-def calculate_moving_average(data: List[float], window: int) -> List[float]:
+
+def _check_finite(arr: np.ndarray, name: str) -> None:
+    """
+    Rejects NaN/inf up front; they would otherwise poison every later value
+    of the recursive averages without any error.
+    """
+    if _use_kernels(arr):
+        finite = _kernels.all_finite(arr.reshape(-1))
+    else:
+        finite = bool(np.isfinite(arr).all())
+    if not finite:
+        raise ValueError(f"{name} must contain only finite numbers.")
+
+
+def _use_kernels(arr: np.ndarray) -> bool:
+    """Whether the kernels handle ``arr``'s dtype; compiles them on first use."""
+    if not (_kernels.ACCELERATED and arr.dtype in _kernels.DTYPES):
+        return False
+    _kernels.ensure_compiled(arr.dtype)
+    return True
+
+
+def _rolling_windows(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Strided view of the trailing windows along the last axis: shape
+    ``(..., n - window + 1, window)`` for ``n`` values per series.
+    """
+    return sliding_window_view(values, window, axis=-1)
+
+
+def _result(values: np.ndarray, as_list: bool) -> Indicator:
+    """
+    Returns ``values`` as a writable ``DTYPE`` array (pandas results, which
+    are float64 and possibly read-only, are converted), or as a list when
+    ``as_list`` is True.
+    """
+    values = values.astype(DTYPE, copy=False)
+    if as_list:
+        warnings.warn(
+            "as_list=True is deprecated; indicators return NumPy arrays, "
+            "call .tolist() on the result if a list is needed.",
+            DeprecationWarning,
+            stacklevel=3,
+        )
+        as_list_values: List[float] = values.tolist()
+        return as_list_values
+    return values if values.flags.writeable else values.copy()
+
+
+def calculate_moving_average(
+    data: ArrayLike, window: int, as_list: bool = False
+) -> Indicator:
     """
     Calculates the Simple Moving Average (SMA) for a given dataset.
 
     Args:
-        data: A list of floats representing the price data.
+        data: A list, array or Series of floats representing the price data.
         window: The number of periods to use for the moving average calculation.
+        as_list: Deprecated; return a list instead of the array.
 
     Returns:
-        A list of floats representing the moving average.
+        The moving average values.
     """
-    if not isinstance(data, list) or not all(
-        isinstance(x, (int, float)) for x in data
-    ):
-        raise TypeError("data must be a list of numbers.")
+    data = _to_dtype(data, "data")
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("window must be a positive integer.")
+    if _use_kernels(data):
+        sma = np.empty_like(data)
+        _kernels.rolling_mean(data, window, sma)
+    else:
+        sma = pd.Series(data, copy=False).rolling(window=window).mean().to_numpy()
+    return _result(sma, as_list)
+
+
+def calculate_moving_average_batch(data_matrix: MatrixLike, window: int) -> np.ndarray:
+    """
+    Calculates the Simple Moving Average of several equally long series at once.
+
+    Args:
+        data_matrix: A 2-D array (or list of lists) with one price series per row.
+        window: The number of periods to use for the moving average calculation.
+
+    Returns:
+        A ``DTYPE`` array shaped like ``data_matrix`` (NaN until the window fills).
+    """
+    matrix = _to_dtype_2d(data_matrix, "data_matrix")
     if not isinstance(window, int) or window <= 0:
         raise ValueError("window must be a positive integer.")
-    return pd.Series(data).rolling(window=window).mean().tolist()
+
+    sma = np.full(matrix.shape, np.nan, dtype=matrix.dtype)
+    if matrix.shape[1] >= window:
+        _rolling_windows(matrix, window).mean(axis=-1, out=sma[:, window - 1 :])
+    return sma
 
 
 def calculate_exponential_moving_average(
-    data: List[float], window: int
-) -> List[float]:
+    data: ArrayLike, window: int, as_list: bool = False
+) -> Indicator:
     """
     Calculates the Exponential Moving Average (EMA) for a given dataset.
 
     Args:
-        data: A list of floats representing the price data.
+        data: A list, array or Series of floats representing the price data.
         window: The number of periods to use for the EMA calculation.
+        as_list: Deprecated; return a list instead of the array.
 
     Returns:
-        A list of floats representing the exponential moving average.
+        The exponential moving average values.
     """
-    if not isinstance(data, list) or not all(
-        isinstance(x, (int, float)) for x in data
-    ):
-        raise TypeError("data must be a list of numbers.")
+    data = _to_dtype(data, "data")
     if not isinstance(window, int) or window <= 0:
         raise ValueError("window must be a positive integer.")
-    return (
-        pd.Series(data)
-        .ewm(span=window, adjust=False)
-        .mean()
-        .tolist()
-    )
+    if _use_kernels(data):
+        ema = np.empty_like(data)
+        _kernels.ewma(data, 2 / (window + 1), ema)
+    else:
+        ema = (
+            pd.Series(data, copy=False).ewm(span=window, adjust=False).mean().to_numpy()
+        )
+    return _result(ema, as_list)
+
+
+def calculate_exponential_moving_average_batch(
+    data_matrix: MatrixLike, window: int
+) -> np.ndarray:
+    """
+    Calculates the Exponential Moving Average of several equally long series
+    in one pandas call (one column per series).
 
+    Args:
+        data_matrix: A 2-D array (or list of lists) with one price series per row.
+        window: The number of periods to use for the EMA calculation.
 
-def calculate_rsi(data: List[float], window: int = 14) -> List[float]:
+    Returns:
+        A ``DTYPE`` array shaped like ``data_matrix``.
     """
-    Calculates the Relative Strength Index (RSI).
+    matrix = _to_dtype_2d(data_matrix, "data_matrix")
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("window must be a positive integer.")
+    ema = pd.DataFrame(matrix.T, copy=False).ewm(span=window, adjust=False).mean()
+    return np.ascontiguousarray(ema.to_numpy().T, dtype=matrix.dtype)
+
+
+def calculate_rsi(
+    data: ArrayLike, window: int = 14, as_list: bool = False
+) -> Indicator:
+    """
+    Calculates the Relative Strength Index (RSI) with Wilder's smoothing.
 
     Args:
-        data: A list of floats representing the price data.
+        data: A list, array or Series of floats representing the price data.
         window: The number of periods to use for the RSI calculation.
+        as_list: Deprecated; return a list instead of the array.
 
     Returns:
-        A list of floats representing the RSI values.
+        The RSI values (empty when there are fewer than ``window`` prices).
     """
-    if not isinstance(data, list) or not all(
-        isinstance(x, (int, float)) for x in data
-    ):
-        raise TypeError("data must be a list of numbers.")
+    data = _to_dtype(data, "data")
     if not isinstance(window, int) or window <= 0:
         raise ValueError("window must be a positive integer.")
     if len(data) < window:
-        return []
+        return _result(np.empty(0, dtype=DTYPE), as_list)
+
+    rsi = np.full(len(data), np.nan, dtype=data.dtype)
+    if len(data) > window:
+        if _use_kernels(data):
+            _kernels.rsi(data, window, rsi)
+        else:
+            _rsi_into(data, window, rsi)
+    return _result(rsi, as_list)
 
-    series = pd.Series(data)
-    delta = series.diff()
 
-    gains = delta.clip(lower=0)
-    losses = -delta.clip(upper=0)
+def calculate_rsi_batch(data_matrix: MatrixLike, window: int = 14) -> np.ndarray:
+    """
+    Calculates the Wilder RSI of several equally long price series at once.
 
-    avg_gain = gains.rolling(window=window).mean()
-    avg_loss = losses.rolling(window=window).mean()
+    With numba available the rows are processed in parallel threads.
 
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
+    Args:
+        data_matrix: A 2-D array (or list of lists) with one price series per row.
+        window: The number of periods to use for the RSI calculation.
+
+    Returns:
+        A ``DTYPE`` array shaped like ``data_matrix`` holding the RSI of each row
+        (NaN before ``window``, as in ``calculate_rsi``).
+    """
+    matrix = _to_dtype_2d(data_matrix, "data_matrix")
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("window must be a positive integer.")
 
-    no_loss_mask = (avg_loss == 0) & (avg_gain > 0)
-    neutral_mask = (avg_gain == 0) & (avg_loss == 0)
+    rsi = np.full(matrix.shape, np.nan, dtype=matrix.dtype)
+    if matrix.shape[1] <= window:
+        return rsi
+    if _use_kernels(matrix):
+        _kernels.rsi_batch(matrix, window, rsi)
+    else:
+        _rsi_into(matrix, window, rsi)
+    return rsi
 
-    rsi = rsi.where(~no_loss_mask, 100.0)
-    rsi = rsi.where(~neutral_mask, 50.0)
 
-    return rsi.tolist()
+def _rsi_into(data: np.ndarray, window: int, out: np.ndarray) -> None:
+    """
+    NumPy/pandas Wilder RSI along the last axis of ``data`` (one series or
+    one per row) written into ``out[..., window:]``.
+    """
+    delta = np.diff(data, axis=-1)
+    avg_gain = _wilder_average(np.clip(delta, 0.0, None), window)
+    avg_loss = _wilder_average(np.clip(-delta, 0.0, None), window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs_rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    # No losses: 100 if there were gains, neutral 50 if the price was flat
+    out[..., window:] = np.where(
+        avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), rs_rsi
+    )
+
+
+def _wilder_average(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder's smoothing of ``values`` along the last axis: seeded with the mean
+    of the first ``window`` values, then ``avg = (avg * (window - 1) + value) / window``.
+
+    Returns one average per value from index ``window - 1`` onwards.
+    """
+    seeded = values[..., window - 1 :].copy()
+    seeded[..., 0] = values[..., :window].mean(axis=-1)
+    columns = pd.DataFrame(seeded.reshape(-1, seeded.shape[-1]).T, copy=False)
+    smoothed = columns.ewm(alpha=1 / window, adjust=False).mean().to_numpy()
+    averages: np.ndarray = smoothed.T.reshape(seeded.shape)
+    return averages
 
 
 def calculate_macd(
-    data: List[float], fast_period: int = 12, slow_period: int = 26, signal_period: int = 9
-) -> Tuple[List[float], List[float], List[float]]:
+    data: ArrayLike,
+    fast_period: int = 12,
+    slow_period: int = 26,
+    signal_period: int = 9,
+    as_list: bool = False,
+) -> Tuple[Indicator, Indicator, Indicator]:
     """
     Calculates the Moving Average Convergence Divergence (MACD).
 
     Args:
-        data: A list of floats representing the price data.
+        data: A list, array or Series of floats representing the price data.
         fast_period: The number of periods for the fast EMA.
         slow_period: The number of periods for the slow EMA.
         signal_period: The number of periods for the signal line EMA.
+        as_list: Deprecated; return lists instead of arrays.
 
     Returns:
-        A tuple containing three lists: MACD line, signal line, and histogram.
+        A tuple containing the MACD line, signal line, and histogram.
     """
-    if not isinstance(data, list) or not all(
-        isinstance(x, (int, float)) for x in data
-    ):
-        raise TypeError("data must be a list of numbers.")
+    data = _to_dtype(data, "data")
     if not all(
-        isinstance(p, int) and p > 0
-        for p in [fast_period, slow_period, signal_period]
+        isinstance(p, int) and p > 0 for p in [fast_period, slow_period, signal_period]
     ):
         raise ValueError("All period arguments must be positive integers.")
     if slow_period <= fast_period:
         raise ValueError("slow_period must be greater than fast_period.")
 
-    series = pd.Series(data)
-    fast_ema = series.ewm(span=fast_period, adjust=False).mean()
-    slow_ema = series.ewm(span=slow_period, adjust=False).mean()
-    macd_line = fast_ema - slow_ema
-    signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-    histogram = macd_line - signal_line
+    if _use_kernels(data):
+        macd_line = np.empty_like(data)
+        signal_line = np.empty_like(data)
+        histogram = np.empty_like(data)
+        _kernels.macd(
+            data,
+            2.0 / (fast_period + 1),
+            2.0 / (slow_period + 1),
+            2.0 / (signal_period + 1),
+            macd_line,
+            signal_line,
+            histogram,
+        )
+    else:
+        series = pd.Series(data, copy=False)
+        fast_ema = series.ewm(span=fast_period, adjust=False).mean()
+        slow_ema = series.ewm(span=slow_period, adjust=False).mean()
+        macd_series = fast_ema - slow_ema
+        signal_series = macd_series.ewm(span=signal_period, adjust=False).mean()
+        macd_line = macd_series.to_numpy()
+        signal_line = signal_series.to_numpy()
+        histogram = macd_line - signal_line
 
-    return macd_line.tolist(), signal_line.tolist(), histogram.tolist()
+    return (
+        _result(macd_line, as_list),
+        _result(signal_line, as_list),
+        _result(histogram, as_list),
+    )
 
 
 def calculate_bollinger_bands(
-    data: List[float], window: int = 20, num_std_dev: int = 2
-) -> Tuple[List[float], List[float], List[float]]:
+    data: ArrayLike, window: int = 20, num_std_dev: int = 2, as_list: bool = False
+) -> Tuple[Indicator, Indicator, Indicator]:
     """
     Calculates the Bollinger Bands.
 
     Args:
-        data: A list of floats representing the price data.
+        data: A list, array or Series of floats representing the price data.
         window: The number of periods for the moving average.
         num_std_dev: The number of standard deviations.
+        as_list: Deprecated; return lists instead of arrays.
 
     Returns:
-        A tuple containing three lists: upper band, middle band (SMA), and lower band.
+        A tuple containing the upper band, middle band (SMA), and lower band.
     """
-    if not isinstance(data, list) or not all(
-        isinstance(x, (int, float)) for x in data
-    ):
-        raise TypeError("data must be a list of numbers.")
+    data = _to_dtype(data, "data")
     if not isinstance(window, int) or window <= 0:
         raise ValueError("window must be a positive integer.")
     if not isinstance(num_std_dev, (int, float)) or num_std_dev <= 0:
         raise ValueError("num_std_dev must be a positive number.")
 
-    series = pd.Series(data)
-    middle_band = series.rolling(window=window).mean()
-    std_dev = series.rolling(window=window).std()
-    upper_band = middle_band + (std_dev * num_std_dev)
-    lower_band = middle_band - (std_dev * num_std_dev)
+    if _use_kernels(data):
+        upper_band = np.empty_like(data)
+        middle_band = np.empty_like(data)
+        lower_band = np.empty_like(data)
+        _kernels.bollinger(
+            data, window, float(num_std_dev), upper_band, middle_band, lower_band
+        )
+    else:
+        rolling = pd.Series(data, copy=False).rolling(window=window)
+        middle_band = rolling.mean().to_numpy()
+        # pandas' online variance leaves a small residual after the series
+        # turns flat; report exactly 0 there, as the kernel does.
+        flat = (rolling.max() == rolling.min()).to_numpy()
+        std_dev = np.where(flat, 0.0, rolling.std().to_numpy())
+        upper_band = middle_band + (std_dev * num_std_dev)
+        lower_band = middle_band - (std_dev * num_std_dev)
+
+    return (
+        _result(upper_band, as_list),
+        _result(middle_band, as_list),
+        _result(lower_band, as_list),
+    )
+
+
+def calculate_bollinger_bands_batch(
+    data_matrix: MatrixLike, window: int = 20, num_std_dev: int = 2
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Calculates the Bollinger Bands of several equally long series at once.
+
+    Args:
+        data_matrix: A 2-D array (or list of lists) with one price series per row.
+        window: The number of periods for the moving average.
+        num_std_dev: The number of standard deviations.
+
+    Returns:
+        A tuple of ``DTYPE`` arrays shaped like ``data_matrix``: upper band,
+        middle band (SMA), and lower band.
+    """
+    matrix = _to_dtype_2d(data_matrix, "data_matrix")
+    if not isinstance(window, int) or window <= 0:
+        raise ValueError("window must be a positive integer.")
+    if not isinstance(num_std_dev, (int, float)) or num_std_dev <= 0:
+        raise ValueError("num_std_dev must be a positive number.")
 
-    return upper_band.tolist(), middle_band.tolist(), lower_band.tolist()
+    middle_band = np.full(matrix.shape, np.nan, dtype=matrix.dtype)
+    band = np.full(matrix.shape, np.nan, dtype=matrix.dtype)
+    if matrix.shape[1] >= window:
+        windows = _rolling_windows(matrix, window)
+        windows.mean(axis=-1, out=middle_band[:, window - 1 :])
+        if window > 1:
+            windows.std(axis=-1, ddof=1, out=band[:, window - 1 :])
+            band *= num_std_dev
+    return middle_band + band, middle_band, middle_band - band
 
 
 def calculate_stochastic_oscillator(
-    high: List[float],
-    low: List[float],
-    close: List[float],
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
     window: int = 14,
     k_smoothing: int = 3,
-) -> Tuple[List[float], List[float]]:
+    as_list: bool = False,
+) -> Tuple[Indicator, Indicator]:
     """
     Calculates the Stochastic Oscillator.
 
     Args:
-        high: A list of floats representing the high prices.
-        low: A list of floats representing the low prices.
-        close: A list of floats representing the close prices.
+        high: A list, array or Series of floats representing the high prices.
+        low: A list, array or Series of floats representing the low prices.
+        close: A list, array or Series of floats representing the close prices.
         window: The number of periods for the oscillator calculation.
         k_smoothing: The number of periods for smoothing %K to get %D.
+        as_list: Deprecated; return lists instead of arrays.
 
     Returns:
-        A tuple containing two lists: %K (fast) and %D (slow).
+        A tuple containing %K (fast) and %D (slow).
     """
-    if not all(
-        isinstance(data, list) and all(isinstance(x, (int, float)) for x in data)
-        for data in [high, low, close]
-    ):
-        raise TypeError("high, low, and close must be lists of numbers.")
+    high = _to_dtype(high, "high")
+    low = _to_dtype(low, "low")
+    close = _to_dtype(close, "close")
     if len(high) != len(low) or len(low) != len(close):
         raise ValueError("All price lists must have the same length.")
     if not isinstance(window, int) or window <= 0:
@@ -198,96 +482,115 @@ def calculate_stochastic_oscillator(
     if not isinstance(k_smoothing, int) or k_smoothing <= 0:
         raise ValueError("k_smoothing must be a positive integer.")
 
-    high_series = pd.Series(high)
-    low_series = pd.Series(low)
-    close_series = pd.Series(close)
-
-    lowest_low = low_series.rolling(window=window).min()
-    highest_high = high_series.rolling(window=window).max()
+    if _use_kernels(close):
+        percent_k = np.empty_like(close)
+        percent_d = np.empty_like(close)
+        _kernels.stochastic(high, low, close, window, k_smoothing, percent_k, percent_d)
+        return _result(percent_k, as_list), _result(percent_d, as_list)
+
+    if len(close) <= _WINDOW_VIEW_MAX_BARS:
+        lowest_low = np.full_like(close, np.nan)
+        highest_high = np.full_like(close, np.nan)
+        if len(close) >= window:
+            _rolling_windows(low, window).min(axis=-1, out=lowest_low[window - 1 :])
+            _rolling_windows(high, window).max(axis=-1, out=highest_high[window - 1 :])
+    else:
+        lowest_low = pd.Series(low, copy=False).rolling(window=window).min().to_numpy()
+        highest_high = (
+            pd.Series(high, copy=False).rolling(window=window).max().to_numpy()
+        )
 
     price_range = highest_high - lowest_low
-    safe_range = price_range.replace(0, np.nan)
-    percent_k = 100 * (close_series - lowest_low) / safe_range
-    percent_k = percent_k.where(price_range != 0, 0.0)
-    percent_d = percent_k.rolling(window=k_smoothing, min_periods=1).mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        percent_k = 100 * (close - lowest_low) / price_range
+    percent_k[price_range == 0] = 0.0
+    percent_d = (
+        pd.Series(percent_k, copy=False)
+        .rolling(window=k_smoothing, min_periods=1)
+        .mean()
+    )
 
-    return percent_k.tolist(), percent_d.tolist()
+    return _result(percent_k, as_list), _result(percent_d.to_numpy(), as_list)
 
 
 def calculate_average_true_range(
-    high: List[float], low: List[float], close: List[float], window: int = 14
-) -> List[float]:
+    high: ArrayLike,
+    low: ArrayLike,
+    close: ArrayLike,
+    window: int = 14,
+    as_list: bool = False,
+) -> Indicator:
     """
     Calculates the Average True Range (ATR).
 
     Args:
-        high: A list of floats representing the high prices.
-        low: A list of floats representing the low prices.
-        close: A list of floats representing the close prices.
+        high: A list, array or Series of floats representing the high prices.
+        low: A list, array or Series of floats representing the low prices.
+        close: A list, array or Series of floats representing the close prices.
         window: The number of periods for the ATR calculation.
+        as_list: Deprecated; return a list instead of the array.
 
     Returns:
-        A list of floats representing the ATR values.
+        The ATR values.
     """
-    if not all(
-        isinstance(data, list) and all(isinstance(x, (int, float)) for x in data)
-        for data in [high, low, close]
-    ):
-        raise TypeError("high, low, and close must be lists of numbers.")
+    high = _to_dtype(high, "high")
+    low = _to_dtype(low, "low")
+    close = _to_dtype(close, "close")
     if len(high) != len(low) or len(low) != len(close):
         raise ValueError("All price lists must have the same length.")
     if not isinstance(window, int) or window <= 0:
         raise ValueError("window must be a positive integer.")
 
-    high_series = pd.Series(high)
-    low_series = pd.Series(low)
-    close_series = pd.Series(close)
-
-    high_low = high_series - low_series
-    high_close = np.abs(high_series - close_series.shift())
-    low_close = np.abs(low_series - close_series.shift())
+    prev_close = np.empty_like(close)
+    prev_close[:1] = np.nan
+    prev_close[1:] = close[:-1]
 
-    tr = pd.DataFrame(
-        {"high_low": high_low, "high_close": high_close, "low_close": low_close}
-    ).max(axis=1)
-    atr = tr.ewm(alpha=1 / window, adjust=False).mean()
-
-    return atr.tolist()
+    # fmax skips the NaN gaps of the first bar, as DataFrame.max(axis=1) did
+    tr = np.fmax(
+        high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+    if _use_kernels(tr):
+        atr = np.empty_like(tr)
+        _kernels.ewma(tr, 1 / window, atr)
+    else:
+        atr = (
+            pd.Series(tr, copy=False)
+            .ewm(alpha=1 / window, adjust=False)
+            .mean()
+            .to_numpy()
+        )
+    return _result(atr, as_list)
 
 
 def calculate_on_balance_volume(
-    close: List[float], volume: List[float]
-) -> List[float]:
+    close: ArrayLike, volume: ArrayLike, as_list: bool = False
+) -> Indicator:
     """
     Calculates the On-Balance Volume (OBV).
 
     Args:
-        close: A list of floats representing the close prices.
-        volume: A list of floats representing the trading volume.
+        close: A list, array or Series of floats representing the close prices.
+        volume: A list, array or Series of floats representing the trading volume.
+        as_list: Deprecated; return a list instead of the array.
 
     Returns:
-        A list of floats representing the OBV.
+        The OBV values.
     """
-    if not isinstance(close, list) or not all(
-        isinstance(x, (int, float)) for x in close
-    ):
-        raise TypeError("close must be a list of numbers.")
-    if not isinstance(volume, list) or not all(
-        isinstance(x, (int, float)) for x in volume
-    ):
-        raise TypeError("volume must be a list of numbers.")
+    close = _to_dtype(close, "close")
+    volume = _to_dtype(volume, "volume")
     if len(close) != len(volume):
         raise ValueError("close and volume lists must have the same length.")
 
-    close_series = pd.Series(close)
-    volume_series = pd.Series(volume)
-
-    obv = [0.0] * len(close)
-    for i in range(1, len(close)):
-        if close[i] > close[i - 1]:
-            obv[i] = obv[i - 1] + volume[i]
-        elif close[i] < close[i - 1]:
-            obv[i] = obv[i - 1] - volume[i]
-        else:
-            obv[i] = obv[i - 1]
-    return obv
+    if close.size == 0:
+        return _result(np.empty(0, dtype=DTYPE), as_list)
+
+    obv = np.empty_like(close)
+    if _use_kernels(close):
+        _kernels.obv(close, volume, obv)
+    else:
+        # Signed volume accumulated straight into the output buffer
+        signed_volume = np.sign(np.diff(close))
+        signed_volume *= volume[1:]
+        obv[0] = 0.0
+        np.cumsum(signed_volume, out=obv[1:])
+    return _result(obv, as_list)
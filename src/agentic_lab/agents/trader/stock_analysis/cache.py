@@ -0,0 +1,82 @@
+"""
+Memoization of indicator results for repeated calls on the same price history.
+
+Results are keyed by ``(symbol, indicator, params, n)`` where ``n`` is the
+length of the input, and guarded by a digest of the input bytes so that a
+rewritten history of the same length is never served stale results. When a
+longer history arrives for a symbol (new bars appended), every entry of that
+symbol computed on a shorter history is dropped.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+Fingerprint = Tuple[int, bytes]
+
+
+def fingerprint(data: np.ndarray) -> Fingerprint:
+    """Returns the length and a 128-bit BLAKE2b digest of ``data``'s bytes."""
+    data = np.ascontiguousarray(data)
+    return len(data), hashlib.blake2b(data, digest_size=16).digest()
+
+
+class IndicatorCache:
+    """
+    Thread-safe LRU cache of indicator results per symbol.
+
+    Cached values are shared by every hit; callers must not mutate them.
+
+    Args:
+        maxsize: Maximum number of results kept; least recently used go first.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[str, str, Hashable, int], Tuple[bytes, Any]]" = (
+            OrderedDict()
+        )
+        self._last_index: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, symbol: str, indicator: str, params: Hashable, fp: Fingerprint
+    ) -> Optional[Any]:
+        """Returns the cached result for this input, or None on a miss."""
+        n, digest = fp
+        key = (symbol, indicator, params, n)
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] != digest:
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def set(
+        self, symbol: str, indicator: str, params: Hashable, fp: Fingerprint, value: Any
+    ) -> None:
+        """Stores ``value``, invalidating the symbol's results on shorter histories."""
+        n, digest = fp
+        with self._lock:
+            if n > self._last_index.get(symbol, -1):
+                self._last_index[symbol] = n
+                for key in [k for k in self._data if k[0] == symbol and k[3] < n]:
+                    del self._data[key]
+            key = (symbol, indicator, params, n)
+            self._data[key] = (digest, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drops every entry."""
+        with self._lock:
+            self._data.clear()
+            self._last_index.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,106 @@
+"""
+Incremental indicator states for live bars.
+
+Each state holds the running quantities of one indicator and folds in a new
+price in O(1) via ``update``, returning the latest value. Fed a full price
+series bar by bar, the states reproduce the final values of the matching
+``analyzer`` functions (NaN while warming up).
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Tuple
+
+
+@dataclass(slots=True)
+class EMAState:
+    """Exponential moving average seeded with the first price."""
+
+    window: int
+    alpha: float = field(init=False)
+    value: float = field(init=False, default=math.nan)
+
+    def __post_init__(self) -> None:
+        self.alpha = 2 / (self.window + 1)
+
+    def update(self, x: float) -> float:
+        if math.isnan(self.value):
+            self.value = x
+        else:
+            self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+@dataclass(slots=True)
+class SMAState:
+    """Trailing mean over a ring buffer of the last ``window`` prices."""
+
+    window: int
+    _buffer: Deque[float] = field(init=False, default_factory=deque)
+    _sum: float = field(init=False, default=0.0)
+
+    def update(self, x: float) -> float:
+        self._buffer.append(x)
+        self._sum += x
+        if len(self._buffer) > self.window:
+            self._sum -= self._buffer.popleft()
+        return self._sum / self.window if len(self._buffer) == self.window else math.nan
+
+
+@dataclass(slots=True)
+class RSIState:
+    """Wilder RSI: averages seeded with the mean of the first ``window`` changes."""
+
+    window: int
+    value: float = field(init=False, default=math.nan)
+    _prev: float = field(init=False, default=math.nan)
+    _count: int = field(init=False, default=0)
+    _gain: float = field(init=False, default=0.0)
+    _loss: float = field(init=False, default=0.0)
+
+    def update(self, x: float) -> float:
+        prev, self._prev = self._prev, x
+        if math.isnan(prev):
+            return self.value
+        d = x - prev
+        gain = d if d > 0 else 0.0
+        loss = -d if d < 0 else 0.0
+        self._count += 1
+        if self._count < self.window:
+            self._gain += gain
+            self._loss += loss
+            return self.value
+        if self._count == self.window:
+            self._gain = (self._gain + gain) / self.window
+            self._loss = (self._loss + loss) / self.window
+        else:
+            self._gain = (self._gain * (self.window - 1) + gain) / self.window
+            self._loss = (self._loss * (self.window - 1) + loss) / self.window
+        if self._loss == 0.0:
+            self.value = 100.0 if self._gain > 0.0 else 50.0
+        else:
+            self.value = 100.0 - 100.0 / (1.0 + self._gain / self._loss)
+        return self.value
+
+
+@dataclass(slots=True)
+class MACDState:
+    """MACD line, signal line and histogram from three running EMAs."""
+
+    fast_period: int = 12
+    slow_period: int = 26
+    signal_period: int = 9
+    _fast: EMAState = field(init=False)
+    _slow: EMAState = field(init=False)
+    _signal: EMAState = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._fast = EMAState(self.fast_period)
+        self._slow = EMAState(self.slow_period)
+        self._signal = EMAState(self.signal_period)
+
+    def update(self, x: float) -> Tuple[float, float, float]:
+        macd = self._fast.update(x) - self._slow.update(x)
+        signal = self._signal.update(macd)
+        return macd, signal, macd - signal
@@ -2,11 +2,26 @@
 
 from dataclasses import dataclass
 from pprint import pprint
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from agentic_lab.agents.trader.stock_analysis.analyzer import (
+    _to_dtype_2d,
+    calculate_rsi_batch,
+)
+from agentic_lab.agents.trader.stock_analysis.cache import IndicatorCache, fingerprint
+from agentic_lab.agents.trader.stock_analysis.streaming import (
+    EMAState,
+    MACDState,
+    RSIState,
+    SMAState,
+)
 from agentic_lab.core.base import Agent, AgentConfig
 from agentic_lab.core.exceptions import AgentError
 
+_VALID_ACTIONS = frozenset({"buy", "sell", "analyze"})
+
 
 @dataclass
 class TradingConfig(AgentConfig):
@@ -31,12 +46,31 @@ class TradingAgent(Agent):
         self.strategy = config.strategy
         self.risk_tolerance = config.risk_tolerance
         self.positions: Dict[str, Any] = {}
+        self.indicator_cache = IndicatorCache()
+        self.indicator_states: Dict[str, Dict[str, Any]] = {}
+
+    @property
+    def symbols(self) -> List[str]:
+        """Configured symbols.
+
+        Assigning a new list updates the membership checks of ``execute`` and
+        ``analyze_all`` right away; changes made to the list in place take
+        effect at the next ``initialize()``.
+        """
+        return self._symbols
+
+    @symbols.setter
+    def symbols(self, symbols: List[str]) -> None:
+        self._symbols = symbols
+        self._symbol_set: FrozenSet[str] = frozenset(symbols)  # O(1) membership
 
     def initialize(self) -> None:
         """Initialize the trading agent."""
         if not self.symbols:
             raise AgentError("No symbols configured for trading agent")
 
+        self._symbol_set = frozenset(self.symbols)
+
         # Initialize positions tracking
         for symbol in self.symbols:
             self.positions[symbol] = {
@@ -44,6 +78,7 @@ class TradingAgent(Agent):
                 "avg_price": 0.0,
                 "total_value": 0.0,
             }
+            self.indicator_states[symbol] = _new_indicator_states()
 
         self._initialized = True
 
@@ -54,10 +89,10 @@ class TradingAgent(Agent):
         if not self.is_initialized():
             raise AgentError("Trading agent not initialized")
 
-        if symbol not in self.symbols:
+        if symbol not in self._symbol_set:
             raise AgentError(f"Symbol {symbol} not in configured symbols")
 
-        if action not in ["buy", "sell", "analyze"]:
+        if action not in _VALID_ACTIONS:
             raise AgentError(f"Unknown action: {action}")
 
         # This is a placeholder implementation
@@ -72,6 +107,83 @@ class TradingAgent(Agent):
 
         return result
 
+    def analyze_all(
+        self, prices: Dict[str, Sequence[float]], window: int = 14
+    ) -> Dict[str, np.ndarray]:
+        """Compute the RSI of every symbol's close series in one batched call.
+
+        All series must be finite numbers of the same length; they are
+        validated and stacked into one matrix (see ``analyzer._to_dtype_2d``)
+        so the indicator runs across symbols at once. Results are memoized in
+        ``indicator_cache``, so only symbols whose history changed since the
+        last call are recomputed. Returned arrays are shared with the cache
+        and therefore read-only.
+        """
+        if not self.is_initialized():
+            raise AgentError("Trading agent not initialized")
+
+        unknown = [symbol for symbol in prices if symbol not in self._symbol_set]
+        if unknown:
+            raise AgentError(f"Symbols {unknown} not in configured symbols")
+        if not prices:
+            return {}
+
+        try:
+            closes = _to_dtype_2d(list(prices.values()), "Price series")
+        except (TypeError, ValueError) as exc:
+            raise AgentError(
+                f"Price series must be finite numbers of equal length: {exc}"
+            ) from exc
+
+        result: Dict[str, np.ndarray] = {}
+        misses = []
+        for row, symbol in enumerate(prices):
+            fp = fingerprint(closes[row])
+            cached = self.indicator_cache.get(symbol, "rsi", window, fp)
+            if cached is None:
+                misses.append((row, symbol, fp))
+            else:
+                result[symbol] = cached
+
+        if misses:
+            try:
+                rsi = calculate_rsi_batch(closes[[row for row, _, _ in misses]], window)
+            except Exception as exc:
+                raise AgentError(f"Cannot analyze price series: {exc}") from exc
+            for values, (_, symbol, fp) in zip(rsi, misses):
+                values.flags.writeable = False  # shared by later cache hits
+                self.indicator_cache.set(symbol, "rsi", window, fp, values)
+                result[symbol] = values
+        return {symbol: result[symbol] for symbol in prices}
+
+    def on_new_bar(self, symbol: str, ohlcv: Mapping[str, float]) -> Dict[str, float]:
+        """Fold one new bar into the symbol's live indicators in constant time.
+
+        ``ohlcv`` needs a ``"close"`` price; the other fields are ignored for
+        now. Returns the latest indicator values (NaN while warming up).
+        """
+        if not self.is_initialized():
+            raise AgentError("Trading agent not initialized")
+
+        states = self.indicator_states.get(symbol)
+        if states is None:
+            raise AgentError(f"Symbol {symbol} not in configured symbols")
+        try:
+            close = float(ohlcv["close"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise AgentError(f"Bar for {symbol} has no numeric close price") from exc
+
+        macd, macd_signal, macd_histogram = states["macd"].update(close)
+        return {
+            "close": close,
+            "sma_20": states["sma_20"].update(close),
+            "ema_20": states["ema_20"].update(close),
+            "rsi": states["rsi"].update(close),
+            "macd": macd,
+            "macd_signal": macd_signal,
+            "macd_histogram": macd_histogram,
+        }
+
     def get_portfolio_summary(self) -> Dict[str, Any]:
         """Get portfolio summary."""
         return {
@@ -80,6 +192,17 @@ class TradingAgent(Agent):
             "symbols_count": len(self.symbols),
         }
 
+
+def _new_indicator_states() -> Dict[str, Any]:
+    """Fresh streaming states for the indicators tracked by ``on_new_bar``."""
+    return {
+        "sma_20": SMAState(20),
+        "ema_20": EMAState(20),
+        "rsi": RSIState(14),
+        "macd": MACDState(),
+    }
+
+
 def main() -> None:
     """Run a demo workflow with the simulated trading agent."""
     config = TradingConfig(
@@ -1,9 +1,11 @@
 """Utilities module for common helper functions."""
 
+from .cache import TTLCache
 from .logging import setup_logger
 from .validators import validate_config
 
 __all__ = [
+    "TTLCache",
     "setup_logger",
     "validate_config",
 ]
@@ -4,6 +4,8 @@ import logging
 import sys
 from typing import Optional
 
+_DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
 
 def setup_logger(
     name: str, level: str = "INFO", format_string: Optional[str] = None
@@ -11,6 +13,9 @@ def setup_logger(
     """
     Set up a logger with consistent formatting.
 
+    The stdout handler is attached only when the logger has none, so repeated
+    calls just apply ``level``.
+
     Args:
         name: Logger name
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -19,17 +24,13 @@ def setup_logger(
     Returns:
         Configured logger instance
     """
-    if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
 
     # Avoid duplicate handlers
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(format_string)
-        handler.setFormatter(formatter)
+        handler.setFormatter(logging.Formatter(format_string or _DEFAULT_FORMAT))
         logger.addHandler(handler)
 
     return logger
@@ -1,11 +1,40 @@
 """Test configuration and fixtures."""
 
+import os
+
+import numpy as np
 import pytest
 
+from agentic_lab.agents.trader.stock_analysis import analyzer
 from agentic_lab.agents.trader.trading import TradingConfig
 from agentic_lab.core.base import AgentConfig
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warmup_numba():
+    """
+    Compile the indicator kernels once per session, before any test is timed.
+
+    Set ``AGENTIC_SKIP_WARMUP=1`` to skip it (e.g. when running tests that
+    never touch the indicators).
+    """
+    if os.environ.get("AGENTIC_SKIP_WARMUP") == "1":
+        return
+    prices = np.asarray([1.0, 2.0, 3.0, 4.0, 5.0])
+    try:
+        analyzer.calculate_moving_average(prices, 2)
+        analyzer.calculate_exponential_moving_average(prices, 2)
+        analyzer.calculate_rsi(prices, 2)
+        analyzer.calculate_rsi_batch(prices[np.newaxis], 2)
+        analyzer.calculate_macd(prices)
+        analyzer.calculate_bollinger_bands(prices, 2)
+        analyzer.calculate_stochastic_oscillator(prices, prices, prices, 2)
+        analyzer.calculate_average_true_range(prices, prices, prices, 2)
+        analyzer.calculate_on_balance_volume(prices, prices)
+    except Exception:
+        pass  # the indicator tests report real failures
+
+
 @pytest.fixture
 def basic_agent_config():
     """Basic agent configuration for testing."""
@@ -1,7 +1,9 @@
 """Tests for trading agent."""
 
+import numpy as np
 import pytest
 
+from agentic_lab.agents.trader.stock_analysis.analyzer import calculate_rsi
 from agentic_lab.agents.trader.trading import TradingAgent, TradingConfig
 from agentic_lab.core.exceptions import AgentError
 
@@ -86,6 +88,11 @@ def test_trading_agent_execute_invalid_symbol(trading_config):
     with pytest.raises(AgentError, match="Symbol GOOGL not in configured symbols"):
         agent.execute("buy", "GOOGL", 10)
 
+    agent.symbols = ["GOOGL"]
+    assert agent.execute("buy", "GOOGL", 10)["status"] == "simulated"
+    with pytest.raises(AgentError, match="Symbol AAPL not in configured symbols"):
+        agent.execute("buy", "AAPL", 10)
+
 
 def test_trading_agent_execute_invalid_action(trading_config):
     """Test trading agent execution with invalid action."""
@@ -107,3 +114,85 @@ def test_trading_agent_portfolio_summary(trading_config):
     assert "symbols_count" in summary
     assert summary["symbols_count"] == 2
     assert summary["total_value"] == 0.0
+
+
+def test_trading_agent_analyze_all(trading_config):
+    """Test batched RSI over every configured symbol."""
+    agent = TradingAgent(trading_config)
+    agent.initialize()
+    rng = np.random.default_rng(0)
+    prices = {
+        "AAPL": list(100 + rng.standard_normal(40).cumsum()),
+        "MSFT": list(50 + rng.standard_normal(40).cumsum()),
+    }
+
+    result = agent.analyze_all(prices, window=14)
+
+    assert list(result) == ["AAPL", "MSFT"]
+    for symbol, series in prices.items():
+        np.testing.assert_allclose(result[symbol], calculate_rsi(series, 14))
+
+
+def test_trading_agent_analyze_all_uses_cache(trading_config, monkeypatch):
+    """Test that unchanged histories are served from the indicator cache."""
+    from agentic_lab.agents.trader import trading
+
+    batches = []
+    real_batch = trading.calculate_rsi_batch
+
+    def counting_batch(matrix, window):
+        batches.append(len(matrix))
+        return real_batch(matrix, window)
+
+    monkeypatch.setattr(trading, "calculate_rsi_batch", counting_batch)
+    agent = TradingAgent(trading_config)
+    agent.initialize()
+    closes = list(100 + np.arange(30.0) % 7)
+    prices = {"AAPL": closes, "MSFT": closes[::-1]}
+
+    first = agent.analyze_all(prices)
+    second = agent.analyze_all(prices)
+    assert batches == [2]
+    assert second["AAPL"] is first["AAPL"]
+    with pytest.raises(ValueError, match="read-only"):
+        first["AAPL"][-1] = 0.0
+
+    # Appending a bar recomputes that symbol only and evicts its old entry.
+    agent.analyze_all({"AAPL": closes + [101.0]})
+    assert batches == [2, 1]
+    assert len(agent.indicator_cache) == 2
+
+
+def test_trading_agent_on_new_bar(trading_config):
+    """Test that live bars update the symbol's streaming indicators."""
+    agent = TradingAgent(trading_config)
+    agent.initialize()
+    closes = 100 + np.arange(30.0)
+
+    for close in closes:
+        latest = agent.on_new_bar("AAPL", {"close": close, "volume": 1000.0})
+
+    assert latest["sma_20"] == pytest.approx(closes[-20:].mean())
+    assert latest["rsi"] == 100.0
+    assert np.isnan(agent.on_new_bar("MSFT", {"close": 50.0})["sma_20"])
+    with pytest.raises(AgentError, match="not in configured symbols"):
+        agent.on_new_bar("TSLA", {"close": 1.0})
+    with pytest.raises(AgentError, match="close price"):
+        agent.on_new_bar("AAPL", {"open": 1.0})
+
+
+def test_trading_agent_analyze_all_rejects_bad_input(trading_config):
+    """Test analyze_all rejects unknown symbols, ragged and non-numeric series."""
+    agent = TradingAgent(trading_config)
+    agent.initialize()
+
+    with pytest.raises(AgentError, match="not in configured symbols"):
+        agent.analyze_all({"TSLA": [1.0, 2.0]})
+    with pytest.raises(AgentError, match="equal length"):
+        agent.analyze_all({"AAPL": [1.0, 2.0, 3.0], "MSFT": [1.0, 2.0]})
+    with pytest.raises(AgentError, match="finite"):
+        agent.analyze_all({"AAPL": [1.0, float("nan"), 3.0]})
+    with pytest.raises(AgentError, match="numbers"):
+        agent.analyze_all({"AAPL": ["1.0", "2.0", "3.0"]})
+    with pytest.raises(AgentError, match="Cannot analyze"):
+        agent.analyze_all({"AAPL": [1.0, 2.0, 3.0]}, window="14")
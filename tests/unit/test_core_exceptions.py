@@ -0,0 +1,28 @@
+"""Tests for core exceptions."""
+
+import pytest
+
+from agentic_lab.core.exceptions import (
+    AgentError,
+    AgenticLabError,
+    ConfigurationError,
+    ValidationError,
+)
+
+
+@pytest.mark.parametrize(
+    "exc_cls", [AgenticLabError, AgentError, ConfigurationError, ValidationError]
+)
+def test_exception_contract(exc_cls):
+    with pytest.raises(AgenticLabError, match="^msg$") as exc_info:
+        raise exc_cls("msg")
+    e = exc_info.value
+    assert type(e) is exc_cls
+    assert str(e) == "msg" and e.message == "msg" and e.code is None
+
+
+def test_agentic_lab_error_with_code():
+    e = AgenticLabError("msg", code="E001")
+    assert str(e) == "msg"
+    assert e.message == "msg"
+    assert e.code == "E001"
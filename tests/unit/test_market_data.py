@@ -0,0 +1,119 @@
+"""Tests for MarketDataProvider (offline, yfinance replaced by a stub)."""
+
+import logging
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agentic_lab.agents.trader import market_data
+from agentic_lab.agents.trader.config import TickerResearchConfig
+from agentic_lab.agents.trader.market_data import MarketDataProvider
+
+
+class _FakeTicker:
+    calls = 0
+    empty = False
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+
+    def history(self, period):
+        type(self).calls += 1
+        n = 0 if type(self).empty else int(period.rstrip("d"))
+        close = 100 + np.arange(n, dtype=float)
+        return pd.DataFrame(
+            {"Close": close, "High": close + 1, "Low": close - 1, "Volume": 1000.0}
+        )
+
+
+class _FakeYF:
+    Ticker = _FakeTicker
+
+
+@pytest.fixture
+def fake_yf(monkeypatch, tmp_path):
+    _FakeTicker.calls = 0
+    _FakeTicker.empty = False
+    monkeypatch.setattr(market_data, "yf", _FakeYF)
+    monkeypatch.setattr(market_data, "_CACHE_DIR", tmp_path / "yf")
+    market_data._fetch_history.cache_clear()
+    yield _FakeTicker
+    market_data._fetch_history.cache_clear()
+
+
+def _provider(**kw):
+    cfg = TickerResearchConfig(name="researcher", ticker="AAPL", lookback_days=21, **kw)
+    return MarketDataProvider(cfg, logging.getLogger("test.market_data"))
+
+
+def test_fetch_market_data_is_cached(fake_yf, tmp_path):
+    first = _provider().fetch_market_data()
+    second = _provider().fetch_market_data()
+    assert first["available"] and second["available"]
+    assert fake_yf.calls == 1
+    assert list((tmp_path / "yf").glob("AAPL_*.pkl"))
+
+    # A fresh process (empty in-memory cache) is served from disk.
+    market_data._fetch_history.cache_clear()
+    third = _provider().fetch_market_data()
+    assert fake_yf.calls == 1
+    assert third["last_close"] == first["last_close"]
+
+
+def test_unreadable_cache_file_is_refetched(fake_yf, tmp_path):
+    day = market_data.date.today().isoformat()
+    bad = tmp_path / "yf" / f"AAPL_90_{day}.pkl"
+    bad.parent.mkdir()
+    bad.write_bytes(b"not a pickle")
+
+    assert _provider().fetch_market_data()["available"]
+    assert fake_yf.calls == 1
+    market_data._fetch_history.cache_clear()
+    assert _provider().fetch_market_data()["available"]
+    assert fake_yf.calls == 1  # the rewritten file loads
+
+
+def test_empty_history_is_not_cached(fake_yf):
+    fake_yf.empty = True
+    assert _provider().fetch_market_data() == {"available": False, "reason": "empty history"}
+    fake_yf.empty = False
+    assert _provider().fetch_market_data()["available"]
+    assert fake_yf.calls == 2
+
+
+def test_stale_cache_days_are_pruned(fake_yf, tmp_path):
+    stale = tmp_path / "yf" / "AAPL_90_2000-01-01.pkl"
+    stale.parent.mkdir()
+    stale.write_bytes(b"")
+    _provider().fetch_market_data()
+    day = market_data.date.today().isoformat()
+    assert [p.name for p in (tmp_path / "yf").iterdir()] == [f"AAPL_90_{day}.pkl"]
+
+
+def test_cache_path_stays_in_cache_dir(fake_yf, tmp_path):
+    day = market_data.date.today().isoformat()
+    assert market_data._fetch_history("../evil", 90, day) is not None
+    assert [p.parent for p in tmp_path.rglob("*.pkl")] == [tmp_path / "yf"]
+    assert market_data._cache_path("BRK.B", 90, day).name == f"BRK.B_90_{day}.pkl"
+    assert market_data._cache_path("A/B", 90, day) != market_data._cache_path("A_B", 90, day)
+
+
+def test_cached_history_not_mutated_by_indicators(fake_yf):
+    result = _provider().fetch_market_data()
+    assert "RSI" in result["dataframe"].columns
+    cached = market_data._fetch_history("AAPL", 90, market_data.date.today().isoformat())
+    assert "RSI" not in cached.columns
+
+
+def test_technical_indicators_on_rising_prices():
+    close = 100 + np.arange(60, dtype=float)
+    df = pd.DataFrame({"Close": close, "High": close + 1, "Low": close - 1})
+    provider = _provider()
+    out = provider.compute_technical_indicators(df)
+
+    assert np.isnan(out["RSI"].iloc[13]) and out["RSI"].iloc[14] == pytest.approx(100.0)
+    assert out["SMA_20"].iloc[-1] == pytest.approx(close[-20:].mean())
+    assert out["SMA_50"].iloc[-1] == pytest.approx(close[-50:].mean())
+    assert (out["MACD_Histogram"] == out["MACD"] - out["MACD_Signal"]).all()
+    assert provider.technical_indicators["rsi_overbought"] is True
@@ -0,0 +1,132 @@
+"""Tests for ScoreProvider (offline, OpenAI replaced by a stub)."""
+
+import logging
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agentic_lab.agents.trader import scoring
+from agentic_lab.agents.trader.config import TickerResearchConfig
+from agentic_lab.agents.trader.scoring import ScoreProvider
+from agentic_lab.agents.trader.search import SearchResult
+
+
+class _FakeCompletions:
+    def __init__(self, requests):
+        self.requests = requests
+
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        message = types.SimpleNamespace(content='{"score": 80}')
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    """Install a stub ``openai`` module; yields a record of clients and requests."""
+    record = types.SimpleNamespace(clients=[], requests=[])
+
+    class OpenAI:
+        def __init__(self, api_key):
+            record.clients.append(self)
+            self.chat = types.SimpleNamespace(completions=_FakeCompletions(record.requests))
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=OpenAI))
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(scoring, "_OPENAI_CLIENT", None)
+    scoring._SENTIMENT_CACHE.clear()
+    yield record
+    scoring._SENTIMENT_CACHE.clear()
+
+
+def _result(title, snippet):
+    return SearchResult(query="q", category="news", title=title, snippet=snippet, url=None)
+
+
+def _provider():
+    cfg = TickerResearchConfig(name="researcher", ticker="AAPL")
+    return ScoreProvider(cfg, logging.getLogger("test.scoring"))
+
+
+def test_sentiment_uses_structured_output_and_cache(fake_openai):
+    results = [_result("AAPL beats estimates", "Record quarter")]
+    provider = _provider()
+
+    assert provider.sentiment_score(results) == pytest.approx(0.8)
+    assert provider.sentiment_score(results) == pytest.approx(0.8)
+    assert len(fake_openai.requests) == 1
+    assert fake_openai.requests[0]["response_format"]["type"] == "json_schema"
+
+
+def test_cached_sentiment_needs_no_api_key(fake_openai, monkeypatch):
+    results = [_result("AAPL beats estimates", "Record quarter")]
+    _provider().sentiment_score(results)
+    monkeypatch.delenv("OPENAI_API_KEY")
+    monkeypatch.delitem(sys.modules, "openai")
+    monkeypatch.setattr(scoring, "_OPENAI_CLIENT", None)
+
+    assert _provider().sentiment_score(results) == pytest.approx(0.8)
+    assert len(fake_openai.requests) == 1
+
+
+def test_openai_client_is_shared(fake_openai):
+    provider = _provider()
+    provider.sentiment_score([_result("a", "one")])
+    _provider().sentiment_score([_result("b", "two")])
+    assert len(fake_openai.requests) == 2
+    assert len(fake_openai.clients) == 1
+
+
+def test_calculate_all_scores_includes_sentiment(fake_openai):
+    scores = _provider().calculate_all_scores(None, [_result("t", "s")])
+    assert scores["sentiment"] == pytest.approx(0.8)
+    assert scores["technical"] == scores["momentum"] == 0.5
+
+
+def test_rsi_score_scalar_matches_array():
+    provider = _provider()
+    rsi = np.array([10.0, 25.0, 28.0, 30.0, 50.0, 70.0, 72.0, 75.0, 90.0])
+    expected = [0.9, 0.9, 0.75, 0.75, 0.5, 0.25, 0.25, 0.15, 0.15]
+    assert provider._rsi_score_normalized(rsi) == pytest.approx(expected)
+    assert isinstance(provider._rsi_score_normalized(50.0), float)
+    assert [provider._rsi_score_normalized(v) for v in rsi] == pytest.approx(expected)
+
+
+def test_score_history_matches_scalar_scores():
+    rng = np.random.default_rng(7)
+    close = 100 + np.cumsum(rng.normal(0, 2, 40))
+    df = pd.DataFrame({
+        "Close": close,
+        "SMA_20": pd.Series(close).rolling(20).mean(),
+        "RSI": rng.uniform(10, 90, 40),
+        "MACD": rng.normal(0, 1, 40),
+        "MACD_Signal": rng.normal(0, 1, 40),
+    })
+    df.loc[:13, "RSI"] = np.nan  # RSI warm-up; SMA_20 is NaN before bar 19
+    provider = _provider()
+    history = provider.score_history(df, sentiment=0.8)
+
+    for i in range(40):
+        window = df.iloc[: i + 1]
+        technical = provider.technical_score(window)
+        momentum = provider.momentum_score(window)
+        assert history["technical"][i] == pytest.approx(technical)
+        assert history["momentum"][i] == pytest.approx(momentum)
+        assert history["composite"][i] == pytest.approx(provider.composite_score(technical, momentum, 0.8))
+    assert history["momentum"][0] == 0.5
+
+
+def test_sentiment_prompt_is_truncated_and_deduplicated(fake_openai):
+    syndicated = "Shares rallied after the earnings beat. " * 20
+    results = [_result("T" * 500, syndicated) for _ in range(3)]
+    results.append(_result("Other", "Supply chain concerns"))
+    _provider().sentiment_score(results)
+
+    prompt = fake_openai.requests[0]["messages"][0]["content"]
+    assert "T" * 120 in prompt and "T" * 121 not in prompt
+    assert syndicated[:300] in prompt and syndicated[:301] not in prompt
+    assert prompt.count("Title: ") == 2
+    assert fake_openai.requests[0]["temperature"] == 0
@@ -0,0 +1,159 @@
+"""Tests for SearchProvider (offline, DDGS replaced by a stub)."""
+
+import logging
+import threading
+import time
+
+import pytest
+
+from agentic_lab.agents.trader import search
+from agentic_lab.agents.trader.config import TickerResearchConfig
+from agentic_lab.agents.trader.search import SearchProvider
+
+
+class _FakeDDGS:
+    """Returns three hits per query; the first URL is shared by every query."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def text(self, q, **kwargs):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(0.02)
+        with cls.lock:
+            cls.active -= 1
+        slug = q.replace(" ", "-")
+        return [
+            {"title": "shared", "body": "dup", "href": "https://example.com/shared"},
+            {"title": f"{q} a", "body": "a", "href": f"https://example.com/{slug}/a"},
+            {"title": f"{q} b", "body": "b", "href": f"https://example.com/{slug}/b"},
+        ]
+
+
+@pytest.fixture(autouse=True)
+def _clear_query_cache(monkeypatch):
+    monkeypatch.setattr(search, "_QUERY_LIMITER", search._TokenBucket(rate=1e6, capacity=100))
+    search._QUERY_CACHE.clear()
+    yield
+    search._QUERY_CACHE.clear()
+    search._SESSIONS.pop(_FakeDDGS, None)
+
+
+def _provider(max_results):
+    cfg = TickerResearchConfig(name="researcher", ticker="AAPL", max_results=max_results)
+    provider = SearchProvider(cfg, logging.getLogger("test.search"))
+    provider._search_backend = _FakeDDGS
+    return provider
+
+
+def test_search_merges_in_query_order():
+    _FakeDDGS.peak = 0
+    queries = [("news", "q1"), ("analysis", "q2"), ("sector", "q3")]
+    results = _provider(max_results=50).search(queries)
+
+    assert [r.url for r in results] == [
+        "https://example.com/shared",
+        "https://example.com/q1/a",
+        "https://example.com/q1/b",
+        "https://example.com/q2/a",
+        "https://example.com/q2/b",
+        "https://example.com/q3/a",
+        "https://example.com/q3/b",
+    ]
+    assert results[0].category == "news"
+    assert _FakeDDGS.peak > 1
+
+
+def test_search_respects_max_results():
+    queries = [("news", f"q{i}") for i in range(6)]
+    results = _provider(max_results=4).search(queries)
+    assert [r.query for r in results] == ["q0", "q0", "q0", "q1"]
+    assert _provider(max_results=4).search([]) == []
+
+
+def test_search_duplicates_do_not_use_up_max_results(monkeypatch):
+    pages = {
+        "q1": ["https://example.com/1"],
+        "q2": ["https://example.com/1", "https://example.com/1", "https://example.com/2"],
+    }
+    monkeypatch.setattr(_FakeDDGS, "text", lambda self, q, **kw: [{"href": u} for u in pages[q]])
+
+    results = _provider(max_results=2).search([("news", "q1"), ("news", "q2")])
+    assert [r.url for r in results] == ["https://example.com/1", "https://example.com/2"]
+
+
+def test_search_reuses_cached_queries(monkeypatch):
+    calls = []
+    real_text = _FakeDDGS.text
+    monkeypatch.setattr(_FakeDDGS, "text", lambda self, q, **kw: calls.append(q) or real_text(self, q, **kw))
+
+    first = _provider(max_results=2).search([("news", "q1")])
+    second = _provider(max_results=5).search([("news", "q1")])
+    assert calls == ["q1"]
+    assert len(first) == 2 and len(second) == 3
+
+
+def test_search_cache_is_per_backend():
+    class _OtherDDGS:
+        def text(self, q, **kwargs):
+            return [{"title": "other", "href": "https://example.org/other"}]
+
+    provider = _provider(max_results=5)
+    provider.search([("news", "q1")])
+    provider._search_backend = _OtherDDGS
+    try:
+        results = provider.search([("news", "q1")])
+    finally:
+        search._SESSIONS.pop(_OtherDDGS, None)
+    assert [r.url for r in results] == ["https://example.org/other"]
+
+
+def test_search_shares_one_backend_session():
+    _provider(max_results=5).search([("news", "q1")])
+    session = search._SESSIONS[_FakeDDGS]
+    _provider(max_results=5).search([("news", "q2")])
+    assert search._SESSIONS[_FakeDDGS] is session
+
+
+def test_build_queries_formats_templates():
+    provider = _provider(max_results=5)
+    queries = provider.build_queries()
+    assert queries[0] == ("news", f"AAPL stock news last {provider.config.lookback_days} days")
+    assert [cat for cat, _ in queries] == [
+        "news", "catalysts", "sentiment", "macro", "fundamentals", "fundamentals", "risk",
+    ]
+
+    provider.config.include_financial_terms = False
+    assert len(provider.build_queries()) == 4
+
+
+def test_token_bucket_paces_after_burst():
+    bucket = search._TokenBucket(rate=20.0, capacity=2)
+    start = time.monotonic()
+    for _ in range(2):
+        bucket.acquire()
+    assert time.monotonic() - start < 0.04  # burst is free
+    for _ in range(2):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.09  # then 20/s
+
+
+def test_url_filter_switches_to_bloom(monkeypatch):
+    class _FakeBloom(set):  # stands in for pybloom_live.BloomFilter
+        def __init__(self, capacity, error_rate):
+            super().__init__()
+            self.capacity, self.error_rate = capacity, error_rate
+
+    monkeypatch.setattr(search, "BloomFilter", _FakeBloom)
+    assert type(search._url_filter(50)) is set
+
+    seen = search._url_filter(500)
+    assert isinstance(seen, _FakeBloom)
+    assert (seen.capacity, seen.error_rate) == (5000, 0.01)
+
+    monkeypatch.setattr(search, "BloomFilter", None)
+    assert type(search._url_filter(500)) is set
@@ -2,136 +2,484 @@
 Unit tests for the stock analysis functions.
 """
 
+import os
+from types import SimpleNamespace
+
 import pytest
+from pytest import approx
 import numpy as np
+import pandas as pd
 from agentic_lab.agents.trader.stock_analysis.analyzer import (
     calculate_moving_average,
+    calculate_moving_average_batch,
     calculate_exponential_moving_average,
+    calculate_exponential_moving_average_batch,
     calculate_rsi,
+    calculate_rsi_batch,
     calculate_macd,
     calculate_bollinger_bands,
+    calculate_bollinger_bands_batch,
     calculate_stochastic_oscillator,
     calculate_average_true_range,
     calculate_on_balance_volume,
 )
+from agentic_lab.agents.trader.stock_analysis.cache import IndicatorCache, fingerprint
+from agentic_lab.agents.trader.stock_analysis.streaming import (
+    EMAState,
+    MACDState,
+    RSIState,
+    SMAState,
+)
+
+
+def _frozen(values):
+    """Read-only float64 array, so module-scoped data cannot leak between tests."""
+    arr = np.asarray(values, dtype=np.float64)
+    arr.flags.writeable = False
+    return arr
+
 
+SAMPLE = [100, 102, 105, 103, 106, 108, 110, 112, 115, 113, 116, 118, 120, 119, 122]
+SAMPLE_NP = _frozen(SAMPLE)
+SAMPLE_HIGH = _frozen(SAMPLE_NP + 2)
+SAMPLE_LOW = _frozen(SAMPLE_NP - 2)
+SAMPLE_VOLUME = [1000 * (i + 1) for i in range(len(SAMPLE))]
+_SD_HEAD = float(np.std(SAMPLE_NP[:5], ddof=1))
+_SD_TAIL = float(np.std(SAMPLE_NP[-5:], ddof=1))
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_data():
-    """Fixture to provide sample stock data for testing."""
-    return [
-        100,
-        102,
-        105,
-        103,
-        106,
-        108,
-        110,
-        112,
-        115,
-        113,
-        116,
-        118,
-        120,
-        119,
-        122,
-    ]
+    """Sample closes as a list (``values``) and array (``np``), plus high/low arrays."""
+    return SimpleNamespace(
+        values=SAMPLE, np=SAMPLE_NP, high=SAMPLE_HIGH, low=SAMPLE_LOW
+    )
 
 
-def test_calculate_moving_average(sample_data):
-    """Test the calculate_moving_average function."""
-    result = calculate_moving_average(sample_data, 5)
-    assert isinstance(result, list)
-    assert len(result) == len(sample_data)
-    # The first 4 values should be NaN, which are converted to None by tolist()
-    assert all(x is not None for x in result[4:])
-    assert result[4] == pytest.approx(103.2)
-    assert result[-1] == pytest.approx(119.0)
+# (indicator, args, leading NaNs of the first output, per-output {index: expected})
+INDICATORS = [
+    pytest.param(
+        calculate_moving_average,
+        (SAMPLE, 5),
+        4,
+        [{4: approx(103.2), -1: approx(119.0)}],
+        id="sma",
+    ),
+    pytest.param(
+        calculate_exponential_moving_average,
+        (SAMPLE, 5),
+        0,
+        [{0: approx(100.0), -1: approx(118.85, abs=1e-2)}],
+        id="ema",
+    ),
+    pytest.param(
+        calculate_rsi,
+        (SAMPLE, 14),
+        14,
+        [{-1: approx(84.375, abs=1e-2)}],
+        id="rsi",
+    ),
+    pytest.param(
+        calculate_macd,
+        (SAMPLE,),
+        0,
+        [
+            {-1: approx(5.14, abs=1e-2)},
+            {-1: approx(3.69, abs=1e-2)},
+            {-1: approx(1.45, abs=1e-2)},
+        ],
+        id="macd",
+    ),
+    pytest.param(
+        calculate_bollinger_bands,
+        (SAMPLE, 5),
+        4,
+        [
+            {
+                4: approx(103.2 + 2 * _SD_HEAD, abs=1e-2),
+                -1: approx(119.0 + 2 * _SD_TAIL, abs=1e-2),
+            },
+            {4: approx(103.2), -1: approx(119.0)},
+            {
+                4: approx(103.2 - 2 * _SD_HEAD, abs=1e-2),
+                -1: approx(119.0 - 2 * _SD_TAIL, abs=1e-2),
+            },
+        ],
+        id="bollinger",
+    ),
+    pytest.param(
+        calculate_stochastic_oscillator,
+        (SAMPLE_HIGH, SAMPLE_LOW, SAMPLE_NP),
+        13,
+        [{-1: approx(91.67, abs=1e-2)}, {-1: approx(89.58, abs=1e-2)}],
+        id="stochastic",
+    ),
+    pytest.param(
+        calculate_average_true_range,
+        (SAMPLE_HIGH, SAMPLE_LOW, SAMPLE_NP),
+        0,
+        [{-1: approx(4.23, abs=1e-2)}],
+        id="atr",
+    ),
+    pytest.param(
+        calculate_on_balance_volume,
+        (SAMPLE, SAMPLE_VOLUME),
+        0,
+        [{-1: 63000.0}],
+        id="obv",
+    ),
+]
 
 
-def test_calculate_exponential_moving_average(sample_data):
-    """Test the calculate_exponential_moving_average function."""
-    result = calculate_exponential_moving_average(sample_data, 5)
-    assert isinstance(result, list)
-    assert len(result) == len(sample_data)
-    assert all(isinstance(x, float) for x in result)
-    assert result[0] == pytest.approx(100.0)
-    assert result[-1] == pytest.approx(118.85, abs=1e-2)
+@pytest.fixture(scope="module", autouse=True)
+def warm_indicators():
+    """Call each indicator on a tiny float64 input to compile its kernels up front."""
+    if os.environ.get("AGENTIC_SKIP_WARMUP") == "1":
+        return
+    tiny = np.arange(1.0, 6.0)
+    for param in INDICATORS:
+        indicator, args = param.values[:2]
+        indicator(*(tiny if np.ndim(arg) else min(arg, 2) for arg in args))
 
 
-def test_calculate_rsi(sample_data):
-    """Test the calculate_rsi function."""
-    result = calculate_rsi(sample_data, 14)
-    assert isinstance(result, list)
-    assert len(result) == len(sample_data)
-    assert result[-1] == pytest.approx(84.375, abs=1e-2)
+@pytest.mark.parametrize("indicator, args, nan_head, expected", INDICATORS)
+def test_indicator(indicator, args, nan_head, expected):
+    """Test each indicator's outputs: arrays of the input length with known values."""
+    result = indicator(*args)
+    outputs = result if isinstance(result, tuple) else (result,)
+    assert len(outputs) == len(expected)
+    for output, checks in zip(outputs, expected):
+        assert isinstance(output, np.ndarray)
+        assert output.dtype == np.float64
+        assert len(output) == len(SAMPLE)
+        for index, value in checks.items():
+            assert output[index] == value
+    assert np.isnan(outputs[0][:nan_head]).all()
+    assert np.isfinite(outputs[0][nan_head:]).all()
 
 
-def test_calculate_macd(sample_data):
-    """Test the calculate_macd function."""
-    macd_line, signal_line, histogram = calculate_macd(sample_data)
-    assert isinstance(macd_line, list)
-    assert isinstance(signal_line, list)
-    assert isinstance(histogram, list)
-    assert len(macd_line) == len(sample_data)
-    assert macd_line[-1] == pytest.approx(5.14, abs=1e-2)
-    assert signal_line[-1] == pytest.approx(3.69, abs=1e-2)
-    assert histogram[-1] == pytest.approx(1.45, abs=1e-2)
-
-
-def test_calculate_bollinger_bands(sample_data):
-    """Test the calculate_bollinger_bands function."""
-    upper, middle, lower = calculate_bollinger_bands(sample_data, 5)
-    assert isinstance(upper, list)
-    assert isinstance(middle, list)
-    assert isinstance(lower, list)
-    assert len(upper) == len(sample_data)
-    assert middle[4] == pytest.approx(103.2)
-    assert upper[4] == pytest.approx(103.2 + 2 * np.std(sample_data[:5], ddof=1), abs=1e-2)
-    assert lower[4] == pytest.approx(103.2 - 2 * np.std(sample_data[:5], ddof=1), abs=1e-2)
-    assert middle[-1] == pytest.approx(119.0)
-    assert upper[-1] == pytest.approx(119.0 + 2 * np.std(sample_data[-5:], ddof=1), abs=1e-2)
-    assert lower[-1] == pytest.approx(119.0 - 2 * np.std(sample_data[-5:], ddof=1), abs=1e-2)
-
-
-def test_calculate_stochastic_oscillator(sample_data):
-    """Test the calculate_stochastic_oscillator function."""
-    high = [x + 2 for x in sample_data]
-    low = [x - 2 for x in sample_data]
-    percent_k, percent_d = calculate_stochastic_oscillator(high, low, sample_data)
-    assert isinstance(percent_k, list)
-    assert isinstance(percent_d, list)
-    assert len(percent_k) == len(sample_data)
-    assert percent_k[-1] == pytest.approx(91.67, abs=1e-2)
-    assert percent_d[-1] == pytest.approx(89.58, abs=1e-2)
-
-
-def test_calculate_average_true_range(sample_data):
-    """Test the calculate_average_true_range function."""
-    high = [x + 2 for x in sample_data]
-    low = [x - 2 for x in sample_data]
-    atr = calculate_average_true_range(high, low, sample_data)
-    assert isinstance(atr, list)
-    assert len(atr) == len(sample_data)
-    assert atr[-1] == pytest.approx(4.23, abs=1e-2)
-
-
-def test_calculate_on_balance_volume(sample_data):
-    """Test the calculate_on_balance_volume function."""
-    volume = [1000 * (i + 1) for i in range(len(sample_data))]
-    obv = calculate_on_balance_volume(sample_data, volume)
-    assert isinstance(obv, list)
-    assert len(obv) == len(sample_data)
-    assert obv[-1] == 63000.0
-
-
-def test_invalid_input_types():
+def test_stochastic_window_view_matches_rolling(monkeypatch):
+    """Test the short-series sliding-window path against pandas rolling."""
+    from agentic_lab.agents.trader.stock_analysis import _kernels, analyzer
+
+    monkeypatch.setattr(_kernels, "ACCELERATED", False)
+    rng = np.random.default_rng(3)
+    close = 100 + rng.standard_normal(300).cumsum()
+    high, low = close + 1, close - 1
+    low[50:60] = 90.0
+    high[50:60] = 90.0  # flat range -> %K of 0
+
+    short = calculate_stochastic_oscillator(high, low, close)
+    monkeypatch.setattr(analyzer, "_WINDOW_VIEW_MAX_BARS", 0)
+    rolling = calculate_stochastic_oscillator(high, low, close)
+    for short_values, rolling_values in zip(short, rolling):
+        np.testing.assert_allclose(short_values, rolling_values)
+
+
+
+def test_bollinger_flat_window_has_zero_width(monkeypatch):
+    """Test both Bollinger paths agree and give width 0 once the series turns flat."""
+    from agentic_lab.agents.trader.stock_analysis import _kernels
+
+    # Sliding from spread-out values into a flat run leaves a residual variance
+    # in online updates (a band width of ~5e-7 here without the correction).
+    close = [100.35, 101.17, 101.5, 100.19, 101.1] + [101.55] * 7
+    kernel = calculate_bollinger_bands(close, 3)
+    monkeypatch.setattr(_kernels, "ACCELERATED", False)
+    fallback = calculate_bollinger_bands(close, 3)
+
+    for kernel_values, fallback_values in zip(kernel, fallback):
+        np.testing.assert_allclose(kernel_values, fallback_values, rtol=1e-12)
+    for upper, _, lower in (kernel, fallback):
+        assert (upper[7:] - lower[7:] == 0.0).all()
+
+
+# (indicator, args, expected exception)
+INVALID_INPUTS = [
+    pytest.param(calculate_moving_average, ("not a list", 5), TypeError, id="sma-str"),
+    pytest.param(calculate_moving_average, ([1, 2, 3], 0), ValueError, id="sma-window"),
+    pytest.param(
+        calculate_exponential_moving_average, ([1, "b", 3], 5), TypeError, id="ema-str"
+    ),
+    pytest.param(
+        calculate_exponential_moving_average, ([1, 2, 3], -1), ValueError, id="ema-window"
+    ),
+]
+
+
+@pytest.mark.parametrize("indicator, args, error", INVALID_INPUTS)
+def test_invalid_input_types(indicator, args, error):
     """Test functions with invalid input types."""
+    with pytest.raises(error):
+        indicator(*args)
+
+
+@pytest.mark.parametrize("indicator, args, error", INVALID_INPUTS)
+def test_invalid_inputs_compile_no_kernels(indicator, args, error):
+    """Test error paths raise before dispatch instead of compiling new signatures."""
+    from agentic_lab.agents.trader.stock_analysis import _kernels
+
+    kernels = (_kernels.rolling_mean, _kernels.ewma)
+    if not all(hasattr(k, "signatures") for k in kernels):
+        pytest.skip("requires the numba JIT kernels")
+    _kernels.ensure_compiled(np.dtype(np.float64))
+    before = [list(k.signatures) for k in kernels]
+    with pytest.raises(error):
+        indicator(*args)
+    assert [list(k.signatures) for k in kernels] == before
+
+
+def test_kernels_pinned_to_signatures():
+    """Test the kernels compile only their pinned signatures and reject other types."""
+    from agentic_lab.agents.trader.stock_analysis import _kernels
+
+    if not hasattr(_kernels.rolling_mean, "signatures"):
+        pytest.skip("requires the numba JIT kernels")
+    _kernels.ensure_compiled(np.dtype(np.float64))
+    before = list(_kernels.rolling_mean.signatures)
     with pytest.raises(TypeError):
-        calculate_moving_average("not a list", 5)
-    with pytest.raises(ValueError):
-        calculate_moving_average([1, 2, 3], 0)
+        _kernels.rolling_mean(np.arange(10), 3, np.empty(10, dtype=np.int64))
+    assert list(_kernels.rolling_mean.signatures) == before
+
+
+def test_calculate_on_balance_volume_flat_and_falling():
+    """Test OBV on unchanged and falling closes."""
+    obv = calculate_on_balance_volume([1.0, 2.0, 2.0, 1.0], [10, 20, 30, 40])
+    np.testing.assert_array_equal(obv, [0.0, 20.0, 20.0, -20.0])
+    assert calculate_on_balance_volume([], []).shape == (0,)
+
+
+def test_array_inputs_and_rejected_values(sample_data):
+    """Test that numeric arrays are accepted and non-numeric input rejected."""
+    assert calculate_moving_average(sample_data.np, 5)[4] == pytest.approx(103.2)
+    with pytest.raises(TypeError):
+        calculate_rsi([1, 2, "3"], 2)
+    with pytest.raises(TypeError):
+        calculate_rsi([[1, 2], [3, 4]], 2)
+    with pytest.raises(TypeError):
+        calculate_on_balance_volume([1, 2], [1, None])
+
+
+@pytest.mark.parametrize("bad", [np.nan, np.inf, -np.inf])
+def test_non_finite_inputs_rejected(sample_data, bad):
+    """Test that NaN/inf prices raise instead of silently poisoning results."""
+    prices = sample_data.np.copy()
+    prices[3] = bad
+    with pytest.raises(ValueError, match="finite"):
+        calculate_rsi(prices, 5)
+    with pytest.raises(ValueError, match="finite"):
+        calculate_exponential_moving_average(pd.Series(prices), 5)
+    with pytest.raises(ValueError, match="finite"):
+        calculate_rsi_batch(np.stack([prices, prices]), 5)
+
+
+def test_series_inputs_and_array_outputs(sample_data):
+    """Test read-only Series inputs and writable array outputs."""
+    prices = sample_data.np
+    series = pd.Series(prices)
+    series_view = series.to_numpy()
+    series_view.flags.writeable = False
+
+    rsi = calculate_rsi(pd.Series(series_view), 14)
+    assert isinstance(rsi, np.ndarray) and rsi.flags.writeable
+    np.testing.assert_allclose(rsi, calculate_rsi(sample_data.values, 14))
+
+    upper, middle, lower = calculate_bollinger_bands(series, 5)
+    assert all(isinstance(band, np.ndarray) for band in (upper, middle, lower))
+    assert middle[4] == pytest.approx(103.2)
+    assert calculate_on_balance_volume(prices[:0], prices[:0]).shape == (0,)
+
+
+def test_list_output_is_deprecated(sample_data):
+    """Test that ``as_list=True`` still returns lists but warns."""
+    with pytest.deprecated_call():
+        result = calculate_moving_average(sample_data.values, 5, as_list=True)
+    assert isinstance(result, list)
+    assert result[4] == pytest.approx(103.2)
+    with pytest.deprecated_call():
+        macd_line, _, _ = calculate_macd(sample_data.values, as_list=True)
+    assert isinstance(macd_line, list)
+
+
+def test_calculate_rsi_uses_wilder_smoothing(sample_data):
+    """Test that RSI averages are Wilder-smoothed after the first window."""
+    data = sample_data.values + [118, 121]
+    deltas = np.diff(data)
+    gain = np.clip(deltas[:14], 0, None).mean()
+    loss = np.clip(-deltas[:14], 0, None).mean()
+    for d in deltas[14:]:
+        gain = (gain * 13 + max(d, 0)) / 14
+        loss = (loss * 13 + max(-d, 0)) / 14
+
+    result = calculate_rsi(data, 14)
+    assert np.isnan(result[:14]).all()
+    assert np.isfinite(result[14:]).all()
+    assert result[-1] == pytest.approx(100 - 100 / (1 + gain / loss))
+    assert calculate_rsi([5.0] * 20, 14)[-1] == 50.0
+
+
+def test_calculate_rsi_batch_matches_rows(sample_data):
+    """Test that the batched RSI equals calculate_rsi applied row by row."""
+    rows = [sample_data.values, sample_data.values[::-1], [5.0] * len(sample_data.values)]
+    result = calculate_rsi_batch(rows, 14)
+    assert result.shape == (3, len(sample_data.values))
+    for row, out in zip(rows, result):
+        np.testing.assert_allclose(out, calculate_rsi(row, 14))
+    assert np.isnan(calculate_rsi_batch(rows, 30)).all()
     with pytest.raises(TypeError):
-        calculate_exponential_moving_average([1, "b", 3], 5)
-    with pytest.raises(ValueError):
-        calculate_exponential_moving_average([1, 2, 3], -1)
+        calculate_rsi_batch(sample_data.values, 14)
+
+
+def test_batch_indicators_match_rows(sample_data):
+    """Test the 2-D SMA/EMA/Bollinger functions against the per-series ones."""
+    rows = np.array([sample_data.np, sample_data.np[::-1], np.full(len(sample_data.np), 5.0)])
+
+    sma = calculate_moving_average_batch(rows, 5)
+    ema = calculate_exponential_moving_average_batch(rows, 5)
+    bands = calculate_bollinger_bands_batch(rows, 5)
+    for i, row in enumerate(rows):
+        np.testing.assert_allclose(sma[i], calculate_moving_average(row, 5))
+        np.testing.assert_allclose(ema[i], calculate_exponential_moving_average(row, 5))
+        for batch_band, band in zip(bands, calculate_bollinger_bands(row, 5)):
+            np.testing.assert_allclose(batch_band[i], band, atol=1e-9)
+    assert np.isnan(calculate_moving_average_batch(rows, 30)).all()
+
+
+def test_indicator_cache_checks_content_and_length(sample_data):
+    """Test that cache hits require identical data and appends invalidate."""
+    cache = IndicatorCache()
+    prices = sample_data.np
+    cache.set("AAPL", "sma", 5, fingerprint(prices), "sma-15")
+
+    assert cache.get("AAPL", "sma", 5, fingerprint(prices.copy())) == "sma-15"
+    assert cache.get("AAPL", "sma", 10, fingerprint(prices)) is None
+    assert cache.get("AAPL", "sma", 5, fingerprint(prices[::-1])) is None
+
+    cache.set("AAPL", "sma", 5, fingerprint(np.append(prices, 123.0)), "sma-16")
+    assert cache.get("AAPL", "sma", 5, fingerprint(prices)) is None
+    assert len(cache) == 1
+
+
+def test_streaming_states_match_batch_functions():
+    """Test that bar-by-bar states reproduce the full-history indicators."""
+    rng = np.random.default_rng(7)
+    prices = 100 + rng.standard_normal(60).cumsum()
+    sma, ema, rsi, macd = SMAState(5), EMAState(10), RSIState(14), MACDState()
+
+    streamed = [(sma.update(x), ema.update(x), rsi.update(x), macd.update(x)) for x in prices]
+    sma_out, ema_out, rsi_out, macd_out = map(list, zip(*streamed))
+
+    np.testing.assert_allclose(sma_out, calculate_moving_average(prices, 5))
+    np.testing.assert_allclose(ema_out, calculate_exponential_moving_average(prices, 10))
+    np.testing.assert_allclose(rsi_out, calculate_rsi(prices, 14))
+    np.testing.assert_allclose(np.array(macd_out).T, calculate_macd(prices))
+
+
+@pytest.mark.parametrize("window", [5, 14, 100])
+def test_float32_dtype_tracks_float64(monkeypatch, window):
+    """Test that opting into float32 keeps results close to float64."""
+    from agentic_lab.agents.trader.stock_analysis import analyzer
+
+    rng = np.random.default_rng(1)
+    close = 100 + rng.standard_normal(500).cumsum()
+    high, low = close + rng.random(500), close - rng.random(500)
+    calls = [
+        lambda: calculate_moving_average(close, window),
+        lambda: calculate_exponential_moving_average(close, window),
+        lambda: calculate_rsi(close, window),
+        lambda: calculate_average_true_range(high, low, close, window),
+        lambda: calculate_stochastic_oscillator(high, low, close, window)[0],
+        lambda: calculate_bollinger_bands(close, window)[0],
+    ]
+
+    expected = [call() for call in calls]
+    monkeypatch.setattr(analyzer, "DTYPE", np.float32)
+    for call, reference in zip(calls, expected):
+        result = call()
+        assert result.dtype == np.float32
+        np.testing.assert_allclose(result, reference, rtol=1e-3, atol=1e-3)
+
+
+def test_float32_kernels_compiled_only_on_opt_in():
+    """Test the default float64 path compiles no float32 kernel specializations."""
+    import subprocess
+    import sys
+
+    pytest.importorskip("numba")
+    from agentic_lab.agents.trader.stock_analysis import _kernels
+
+    if _kernels._ta_kernels is not None:
+        pytest.skip("the AOT build replaces the JIT kernels")
+    code = (
+        "import numpy as np\n"
+        "from agentic_lab.agents.trader.stock_analysis import _kernels, analyzer\n"
+        "analyzer.calculate_moving_average(np.arange(30.0), 5)\n"
+        "print(sorted({str(s[0].dtype) for s in _kernels.rolling_mean.signatures}))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "['float64']"
+
+
+def test_aot_kernels_match_jit(tmp_path):
+    """Test the ahead-of-time build loads and agrees with the JIT kernels."""
+    import importlib.util
+    import subprocess
+    import sys
+
+    pytest.importorskip("setuptools")  # numba.pycc raises ImportError without it
+    pytest.importorskip("numba.pycc")
+    from agentic_lab.agents.trader.stock_analysis import _kernels, _kernels_build
+
+    _kernels_build.build(output_dir=str(tmp_path))
+    (path,) = tmp_path.glob("_ta_kernels*")
+    spec = importlib.util.spec_from_file_location("_ta_kernels", path)
+    aot = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(aot)
+
+    rng = np.random.default_rng(5)
+    close = _frozen(100 + rng.standard_normal(60).cumsum())
+    high, low = _frozen(close + 1), _frozen(close - 1)
+    volume = _frozen(rng.integers(1, 1000, 60))
+    # kernel -> (input arrays, scalar arguments, number of output buffers)
+    cases = {
+        "all_finite": ((close,), (), 0),
+        "obv": ((close, volume), (), 1),
+        "rolling_mean": ((close,), (5,), 1),
+        "bollinger": ((close,), (5, 2.0), 3),
+        "macd": ((close,), (2 / 13, 2 / 27, 0.2), 3),
+        "rsi": ((close,), (14,), 1),
+        "stochastic": ((high, low, close), (14, 3), 2),
+        "ewma": ((close,), (0.2,), 1),
+    }
+    assert set(cases) == set(_kernels.AOT_SIGNATURES)
+    for name, (inputs, scalars, n_out) in cases.items():
+        results = []
+        for kernel in (getattr(aot, name), _kernels.JIT_KERNELS[name]):
+            outs = [np.full(len(close), np.nan) for _ in range(n_out)]
+            returned = kernel(*inputs, *scalars, *outs)
+            results.append((returned, outs))
+        (aot_returned, aot_outs), (jit_returned, jit_outs) = results
+        assert aot_returned == jit_returned, name
+        for aot_out, jit_out in zip(aot_outs, jit_outs):
+            np.testing.assert_allclose(aot_out, jit_out, err_msg=name)
+
+    # The JIT-only batch kernel and the trading agent must still work once the
+    # extension replaces the module's kernels (fresh process and JIT cache).
+    code = (
+        "import numpy as np\n"
+        "from agentic_lab.agents.trader import stock_analysis\n"
+        f"stock_analysis.__path__.append({str(tmp_path)!r})\n"
+        "from agentic_lab.agents.trader.stock_analysis import _kernels, analyzer\n"
+        "from agentic_lab.agents.trader.trading import TradingAgent, TradingConfig\n"
+        "assert _kernels._ta_kernels is not None\n"
+        "closes = 100 + np.random.default_rng(5).standard_normal((2, 60)).cumsum(axis=1)\n"
+        "batch = analyzer.calculate_rsi_batch(closes, 14)\n"
+        "rows = [analyzer.calculate_rsi(row, 14) for row in closes]\n"
+        "np.testing.assert_allclose(batch, rows)\n"
+        "agent = TradingAgent(TradingConfig(name='t', symbols=['A', 'B']))\n"
+        "agent.initialize()\n"
+        "result = agent.analyze_all({'A': closes[0], 'B': closes[1]})\n"
+        "np.testing.assert_allclose(result['B'], rows[1])\n"
+    )
+    env = dict(os.environ, NUMBA_CACHE_DIR=str(tmp_path / "numba_cache"))
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
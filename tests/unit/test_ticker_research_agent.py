@@ -12,6 +12,39 @@ from agentic_lab.agents.trader import (
 )
 from agentic_lab.core.exceptions import AgentError
 
+try:
+    import yaml  # type: ignore
+except ImportError:  # pragma: no cover
+    yaml = None
+
+PROFILES_CONTENT = """
+profiles:
+  test_profile:
+    lookback_days: 10
+    max_results: 5
+default_profile: test_profile
+"""
+
+
+@pytest.fixture(scope="session")
+def profiles_yaml(tmp_path_factory):
+    """Path of a profiles YAML written once per session; tests must not modify it."""
+    p = tmp_path_factory.mktemp("cfg") / "profiles.yaml"
+    p.write_text(PROFILES_CONTENT, encoding="utf-8")
+    return p
+
+
+@pytest.fixture(scope="module")
+def initialized_agent_factory():
+    """Build an initialized agent for ``TickerResearchConfig(name="researcher", **kw)``."""
+
+    def _make(**kw):
+        agent = TickerResearchAgent(TickerResearchConfig(name="researcher", **kw))
+        agent.initialize()
+        return agent
+
+    return _make
+
 
 def test_research_config_validation():
     with pytest.raises(AgentError):
@@ -21,6 +54,8 @@ def test_research_config_validation():
     assert cfg.ticker == "AAPL"
     assert cfg.max_results == 8
 
+    assert TickerResearchConfig(name="researcher", ticker="aapl").ticker == "AAPL"
+
 
 def test_research_agent_init_and_initialize():
     cfg = TickerResearchConfig(name="researcher", ticker="MSFT", max_results=3)
@@ -30,34 +65,45 @@ def test_research_agent_init_and_initialize():
     assert agent.is_initialized()
 
 
-def test_profile_application(monkeypatch, tmp_path):
-    try:
-        import yaml  # type: ignore
-    except Exception:  # pragma: no cover
-        pytest.skip("PyYAML not installed; skipping profile test")
-    # Create a temporary profiles YAML
-    content = """
-profiles:
-  test_profile:
-    lookback_days: 10
-    max_results: 5
-default_profile: test_profile
-"""
-    p = tmp_path / "profiles.yaml"
-    p.write_text(content, encoding="utf-8")
-    cfg = TickerResearchConfig(
-        name="researcher", ticker="AAPL", trading_profile="test_profile", profile_config_path=str(p)
-    )
-    agent = TickerResearchAgent(cfg)
-    agent.initialize()
-    assert cfg.lookback_days == 10
-    assert cfg.max_results == 5
+@pytest.mark.skipif(yaml is None, reason="PyYAML not installed")
+class TestProfiles:
+    """Trading-profile loading from YAML files."""
 
+    def test_profile_application(self, profiles_yaml):
+        cfg = TickerResearchConfig(
+            name="researcher",
+            ticker="AAPL",
+            trading_profile="test_profile",
+            profile_config_path=str(profiles_yaml),
+        )
+        agent = TickerResearchAgent(cfg)
+        agent.initialize()
+        assert cfg.lookback_days == 10
+        assert cfg.max_results == 5
+        with pytest.raises(TypeError):
+            agent._profile_manager.profile_meta["lookback_days"] = 1  # type: ignore[index]
 
-def test_extended_report_heuristic(monkeypatch):
-    cfg = TickerResearchConfig(name="researcher", ticker="NFLX", max_results=2, extended_report=True)
-    agent = TickerResearchAgent(cfg)
-    agent.initialize()
+    def test_profile_reloaded_after_file_change(self, tmp_path):
+        p = tmp_path / "profiles.yaml"
+        p.write_text("profiles:\n  p:\n    lookback_days: 10\n", encoding="utf-8")
+        cfg = TickerResearchConfig(
+            name="researcher", ticker="AAPL", trading_profile="p", profile_config_path=str(p)
+        )
+        TickerResearchAgent(cfg).initialize()
+        assert cfg.lookback_days == 10
+
+        p.write_text("profiles:\n  p:\n    lookback_days: 30\n", encoding="utf-8")
+        st = p.stat()
+        os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        cfg = TickerResearchConfig(
+            name="researcher", ticker="AAPL", trading_profile="p", profile_config_path=str(p)
+        )
+        TickerResearchAgent(cfg).initialize()
+        assert cfg.lookback_days == 30
+
+
+def test_extended_report_heuristic(initialized_agent_factory):
+    agent = initialized_agent_factory(ticker="NFLX", max_results=2, extended_report=True)
     # Force no search backend & expect error
     agent._search_backend = None  # type: ignore
     with pytest.raises(AgentError):
@@ -65,14 +111,65 @@ def test_extended_report_heuristic(monkeypatch):
 
 
 @pytest.mark.parametrize("installed", [False])
-def test_execute_without_search_backend(monkeypatch, installed):
+def test_execute_without_search_backend(monkeypatch, installed, initialized_agent_factory):
     # Force DDGS absence
     monkeypatch.setenv("OPENAI_API_KEY", "")
-    cfg = TickerResearchConfig(name="researcher", ticker="GOOGL", max_results=2)
-    agent = TickerResearchAgent(cfg)
-    agent.initialize()
+    agent = initialized_agent_factory(ticker="GOOGL", max_results=2)
 
     # Monkeypatch _search_backend to None to simulate missing dependency
     agent._search_backend = None  # type: ignore
     with pytest.raises(AgentError, match="ddgs not installed"):
         agent.execute()
+
+
+def test_execute_short_circuits_without_market_data(initialized_agent_factory):
+    agent = initialized_agent_factory(ticker="ZZZZ", enable_trading_signals=False)
+    agent._market_data_provider.fetch_market_data = lambda: {"available": False}
+    agent._search_provider._search_backend = None  # search would raise if reached
+
+    result = agent.execute()
+    assert result["error"] == "no market data"
+    assert result["full_report"] is None
+    assert result["sources"] == [] and result["trading_signal"] is None
+
+
+def test_research_tickers_runs_each_ticker(monkeypatch):
+    from agentic_lab.agents.trader import research
+
+    def fake_execute(self, ticker=None):
+        if self.cfg.ticker == "BAD":
+            raise AgentError("boom")
+        return {"ticker": self.cfg.ticker}
+
+    monkeypatch.setattr(research.TickerResearchAgent, "execute", fake_execute)
+    results = research.research_tickers(["aapl", "bad", "msft"], max_workers=2, max_results=3)
+    assert results == [{"ticker": "AAPL"}, {"ticker": "BAD", "error": "boom"}, {"ticker": "MSFT"}]
+    assert research.research_tickers([]) == []
+
+    (failed,) = research.research_tickers([None])
+    assert failed["ticker"] is None and "ticker" in failed["error"]
+
+
+def test_execute_with_new_ticker_keeps_providers(initialized_agent_factory):
+    agent = initialized_agent_factory(ticker="AAPL", enable_trading_signals=False)
+    providers = (agent._market_data_provider, agent._search_provider, agent._report_provider)
+    agent._market_data_provider.fetch_market_data = lambda: {"available": False}
+    agent._market_data_provider.technical_indicators = {"rsi": 55.0}
+
+    result = agent.execute(ticker="msft")
+    assert result["ticker"] == "MSFT"
+    assert (agent._market_data_provider, agent._search_provider, agent._report_provider) == providers
+    assert agent._market_data_provider.technical_indicators == {}
+
+
+def test_package_import_skips_trading_kernels():
+    """Importing the research agent must not load the trading agent or numba."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, agentic_lab.agents.trader as t; t.TickerResearchAgent; "
+        "print(sorted({'numba', 'agentic_lab.agents.trader.trading'} & set(sys.modules)))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
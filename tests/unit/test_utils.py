@@ -11,18 +11,47 @@ from agentic_lab.utils.validators import (
 )
 
 
-def test_setup_logger():
+CUSTOM_FORMAT = "%(name)s - %(message)s"
+
+
+@pytest.fixture(scope="module")
+def loggers():
+    """Loggers configured once for the module: DEBUG level and custom format."""
+    return {
+        "debug": setup_logger("test.logger", "DEBUG"),
+        "custom": setup_logger("test.custom", format_string=CUSTOM_FORMAT),
+    }
+
+
+def test_setup_logger(loggers):
     """Test logger setup."""
-    logger = setup_logger("test.logger", "DEBUG")
+    logger = loggers["debug"]
     assert logger.name == "test.logger"
     assert logger.level == 10  # DEBUG level
 
 
-def test_setup_logger_with_custom_format():
+def test_setup_logger_with_custom_format(loggers):
     """Test logger setup with custom format."""
-    custom_format = "%(name)s - %(message)s"
-    logger = setup_logger("test.custom", format_string=custom_format)
+    logger = loggers["custom"]
     assert logger.name == "test.custom"
+    assert logger.handlers[0].formatter._fmt == CUSTOM_FORMAT
+
+
+def test_setup_logger_configures_handler_once():
+    """Test repeated setup reuses the handler but still applies the level."""
+    first = setup_logger("test.repeat", "INFO")
+    second = setup_logger("test.repeat", "WARNING")
+    assert second is first
+    assert len(second.handlers) == 1
+    assert second.level == 30  # WARNING level
+    assert second.propagate is True
+
+
+def test_setup_logger_reattaches_removed_handler():
+    """Test setup adds a handler again after the previous one was removed."""
+    logger = setup_logger("test.reattach")
+    logger.removeHandler(logger.handlers[0])
+    assert len(setup_logger("test.reattach").handlers) == 1
 
 
 def test_validate_config_success():
@@ -52,16 +81,11 @@ def test_validate_positive_number_valid():
     validate_positive_number(0.1, "test_value")
 
 
-def test_validate_positive_number_invalid():
+@pytest.mark.parametrize("bad", [-1, 0, "not_a_number"])
+def test_validate_positive_number_invalid(bad):
     """Test positive number validation with invalid values."""
     with pytest.raises(ValidationError, match="test_value must be a positive number"):
-        validate_positive_number(-1, "test_value")
-
-    with pytest.raises(ValidationError, match="test_value must be a positive number"):
-        validate_positive_number(0, "test_value")
-
-    with pytest.raises(ValidationError, match="test_value must be a positive number"):
-        validate_positive_number("not_a_number", "test_value")
+        validate_positive_number(bad, "test_value")
 
 
 def test_validate_string_not_empty_valid():
@@ -70,13 +94,29 @@ def test_validate_string_not_empty_valid():
     validate_string_not_empty("  valid with spaces  ", "test_string")
 
 
-def test_validate_string_not_empty_invalid():
+@pytest.mark.parametrize("bad", ["", "   ", 123])
+def test_validate_string_not_empty_invalid(bad):
     """Test string validation with invalid values."""
     with pytest.raises(ValidationError, match="test_string must be a non-empty string"):
-        validate_string_not_empty("", "test_string")
+        validate_string_not_empty(bad, "test_string")
 
-    with pytest.raises(ValidationError, match="test_string must be a non-empty string"):
-        validate_string_not_empty("   ", "test_string")
 
-    with pytest.raises(ValidationError, match="test_string must be a non-empty string"):
-        validate_string_not_empty(123, "test_string")
+def test_ttl_cache_expiry_and_eviction(monkeypatch):
+    """Test TTLCache expiry and LRU eviction."""
+    from agentic_lab.utils import cache as cache_mod
+
+    now = [100.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    cache = cache_mod.TTLCache(maxsize=2, ttl=10)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" is now most recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    now[0] += 10
+    assert cache.get("a", "expired") == "expired"
+    cache.clear()
+    assert len(cache) == 0